@@ -0,0 +1,83 @@
+"""
+Availability queries for one location: build time of the index and time
+per free_devices() call.
+
+    python benchmarks/bench_availability.py [--devices 300] [--reservations 5000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common_models.models.reservations.availability import (  # noqa: E402
+    WEEKDAYS,
+    AvailabilityIndex,
+)
+
+
+def build(devices: int, reservations: int, seed: int = 0):
+    generator = random.Random(seed)
+    sizes = [UUID(int=size) for size in range(1, 4)]
+    rows = [
+        SimpleNamespace(
+            id=UUID(int=generator.getrandbits(128)), id_size=generator.choice(sizes)
+        )
+        for _ in range(devices)
+    ]
+
+    booked = []
+    for _ in range(reservations):
+        start = generator.randrange(24 * 60)
+        end = (start + generator.randrange(30, 6 * 60)) % (24 * 60)
+        days = set(generator.sample(WEEKDAYS, generator.randrange(1, 8)))
+        booked.append(
+            SimpleNamespace(
+                id_device=generator.choice(rows).id,
+                recurring=True,
+                from_time=f"{start // 60:02d}:{start % 60:02d}",
+                to_time=f"{end // 60:02d}:{end % 60:02d}",
+                start_date=None,
+                end_date=None,
+                **{day: day in days for day in WEEKDAYS},
+            )
+        )
+
+    return rows, booked, sizes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--devices", type=int, default=300)
+    parser.add_argument("--reservations", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=1000)
+    args = parser.parse_args()
+
+    devices, reservations, sizes = build(args.devices, args.reservations)
+
+    start = time.perf_counter()
+    index = AvailabilityIndex(devices, reservations)
+    built = time.perf_counter() - start
+
+    generator = random.Random(1)
+    start = time.perf_counter()
+    for _ in range(args.queries):
+        begin = datetime(2026, 1, 5) + timedelta(
+            minutes=generator.randrange(7 * 24 * 60)
+        )
+        index.free_devices(begin, begin + timedelta(hours=2), generator.choice(sizes))
+    queried = (time.perf_counter() - start) / args.queries
+
+    print(f"{'build index':<20} {built * 1000:9.2f} ms")
+    print(f"{'free_devices()':<20} {queried * 1000:9.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
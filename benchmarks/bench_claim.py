@@ -0,0 +1,131 @@
+"""
+Device claiming under contention: many concurrent asyncio tasks starting
+events at one location.
+
+Runs the same burst twice against a local database:
+
+- select-then-update, the unlocked read-modify-write claims used to do;
+- claim_device() with FOR UPDATE SKIP LOCKED.
+
+For each it reports claims, devices claimed twice, failed claims and wall
+time. Claimed devices are set back to available afterwards, and the
+location's status counters are rebuilt.
+
+    python benchmarks/bench_claim.py postgresql+asyncpg://... --location <uuid> [--tasks 200]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+from fastapi import HTTPException
+from fastapi_async_sqlalchemy import SQLAlchemyMiddleware, db
+from sqlalchemy import select, update
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common_models import bootstrap  # noqa: E402
+from common_models.models.device.claim import claim_device  # noqa: E402
+from common_models.models.device.model import Device, Status  # noqa: E402
+from common_models.models.location.device_count import rebuild_counts  # noqa: E402
+
+
+async def claim_unlocked(id_location: UUID, id_size: Optional[UUID]) -> UUID:
+    query = select(Device.id).where(
+        Device.id_location == id_location, Device.status == Status.available
+    )
+    if id_size is not None:
+        query = query.where(Device.id_size == id_size)
+    id = (await db.session.execute(query.limit(1))).scalar()
+    if id is None:
+        raise HTTPException(status_code=404)
+
+    # Stands in for the request work between the read and the write.
+    await asyncio.sleep(0)
+    await db.session.execute(
+        update(Device).where(Device.id == id).values(status=Status.reserved)
+    )
+    return id
+
+
+async def claim_locked(id_location: UUID, id_size: Optional[UUID]) -> UUID:
+    return (await claim_device(id_location, id_size)).id
+
+
+async def task(claim, id_location: UUID, id_size: Optional[UUID]) -> Optional[UUID]:
+    try:
+        async with db(commit_on_exit=True):
+            return await claim(id_location, id_size)
+    except HTTPException:
+        return None
+
+
+async def burst(claim, tasks: int, id_location: UUID, id_size: Optional[UUID]) -> dict:
+    start = time.perf_counter()
+    claimed = await asyncio.gather(
+        *(task(claim, id_location, id_size) for _ in range(tasks))
+    )
+    elapsed = time.perf_counter() - start
+
+    ids = [id for id in claimed if id is not None]
+    async with db(commit_on_exit=True):
+        if ids:
+            await db.session.execute(
+                update(Device)
+                .where(Device.id.in_(set(ids)))
+                .values(status=Status.available)
+            )
+
+    counts = Counter(ids)
+    return {
+        "claims": len(ids),
+        "double": sum(1 for count in counts.values() if count > 1),
+        "failed": claimed.count(None),
+        "ms": elapsed * 1000,
+    }
+
+
+async def run(args) -> int:
+    SQLAlchemyMiddleware(
+        None,
+        db_url=args.url,
+        engine_args={"pool_size": args.pool, "max_overflow": 0},
+    )
+
+    print(f"{'strategy':<22} {'claims':>7} {'double':>7} {'failed':>7} {'ms':>9}")
+    for name, claim in (
+        ("select then update", claim_unlocked),
+        ("skip locked", claim_locked),
+    ):
+        stats = await burst(claim, args.tasks, args.location, args.size)
+        print(
+            f"{name:<22} {stats['claims']:>7} {stats['double']:>7} "
+            f"{stats['failed']:>7} {stats['ms']:>9.1f}"
+        )
+
+    # The bulk UPDATEs above bypass the counter listeners.
+    async with db(commit_on_exit=True):
+        await rebuild_counts([args.location])
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("url", help="Async database URL (postgresql+asyncpg://...)")
+    parser.add_argument("--location", type=UUID, required=True)
+    parser.add_argument("--size", type=UUID)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--pool", type=int, default=20)
+    args = parser.parse_args()
+
+    bootstrap()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Validation and serialization throughput of the hot Read models.
+
+    python benchmarks/bench_models.py                 # run, compare to baseline
+    python benchmarks/bench_models.py --save          # run, store new baseline
+    python benchmarks/bench_models.py -n 2000 Device.Read
+
+For each model it reports validations/sec (parse_obj), .dict()/sec,
+.json()/sec, each the best of --repeat passes, and the peak traced memory
+per instance. A run slower than the saved baseline by more than
+--tolerance exits non-zero. Throughput depends on the machine: re-save
+the baseline before comparing on a different one.
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+HERE = Path(__file__).resolve().parent
+sys.path[:0] = [str(HERE), str(HERE.parent)]
+
+from payloads import Payloads  # noqa: E402
+
+BASELINE = HERE / "baseline.json"
+
+
+def _read_model(module: str, name: str) -> Callable[[], type]:
+    def load() -> type:
+        return getattr(importlib.import_module(module), name).Read
+
+    return load
+
+
+CASES = {
+    "Device.Read": (
+        _read_model("common_models.models.device.model", "Device"),
+        lambda p: p.device(),
+    ),
+    "Event.Read": (
+        _read_model("common_models.models.event.model", "Event"),
+        lambda p: p.event(),
+    ),
+    "Location.Read": (
+        _read_model("common_models.models.location.model", "Location"),
+        lambda p: p.location(devices=[p.device(nested=False) for _ in range(20)]),
+    ),
+}
+
+
+def _rate(count: int, func: Callable[[], object], repeat: int) -> float:
+    # Best of several passes, as timeit does: slower passes are noise.
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def bench(model: type, payloads: list[dict], repeat: int = 5) -> dict:
+    count = len(payloads)
+    instances = [model.parse_obj(payload) for payload in payloads[:10]]  # warm up
+
+    gc.collect()
+    gc.disable()
+    try:
+        validate = _rate(count, lambda: [model.parse_obj(p) for p in payloads], repeat)
+        instances = [model.parse_obj(payload) for payload in payloads]
+        to_dict = _rate(count, lambda: [i.dict() for i in instances], repeat)
+        to_json = _rate(count, lambda: [i.json() for i in instances], repeat)
+    finally:
+        gc.enable()
+
+    del instances
+    gc.collect()
+    tracemalloc.start()
+    kept = [model.parse_obj(payload) for payload in payloads]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    return {
+        "validate_per_s": round(validate, 1),
+        "dict_per_s": round(to_dict, 1),
+        "json_per_s": round(to_json, 1),
+        "peak_kib_per_instance": round(peak / 1024 / count, 3),
+    }
+
+
+def compare(name: str, result: dict, baseline: dict, tolerance: float) -> bool:
+    regressed = False
+    for metric, value in result.items():
+        previous = baseline.get(metric)
+        if not previous:
+            continue
+
+        # Throughput should not drop, memory should not grow.
+        change = (value - previous) / previous
+        if metric.endswith("_per_s"):
+            worse = change < -tolerance
+        else:
+            worse = change > tolerance
+
+        regressed = regressed or worse
+        flag = "  REGRESSION" if worse else ""
+        print(f"    {metric:<24} {previous:>12} -> {value:>12} ({change:+.1%}){flag}")
+    return regressed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("models", nargs="*", help=f"Subset of {', '.join(CASES)}")
+    parser.add_argument("-n", "--number", type=int, default=1000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", action="store_true", help="Write baseline.json")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    results, regressed = {}, False
+
+    for name in args.models or CASES:
+        load, make = CASES[name]
+        try:
+            model = load()
+        except Exception as e:
+            print(f"{name}: skipped, import failed: {type(e).__name__}: {e}")
+            continue
+
+        payloads = Payloads(args.seed)
+        result = bench(model, [make(payloads) for _ in range(args.number)], args.repeat)
+        results[name] = result
+
+        print(name)
+        if name in baseline and not args.save:
+            regressed = (
+                compare(name, result, baseline[name], args.tolerance) or regressed
+            )
+        else:
+            for metric, value in result.items():
+                print(f"    {metric:<24} {value:>12}")
+
+    if args.save:
+        BASELINE.write_text(json.dumps({**baseline, **results}, indent=2) + "\n")
+        print(f"Baseline written to {BASELINE}")
+
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
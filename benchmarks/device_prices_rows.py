@@ -0,0 +1,83 @@
+"""
+Rows transferred when loading devices with their prices.
+
+Compares the old joined loading of Device.prices against the selectin
+default on up to --limit devices of an org, counting the rows every
+statement returns.
+
+    python benchmarks/device_prices_rows.py postgresql+psycopg2://... --org <uuid>
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common_models import bootstrap  # noqa: E402
+from common_models.models import Device  # noqa: E402
+
+
+def run(engine, query) -> dict:
+    stats = {"statements": 0, "rows": 0}
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        stats["statements"] += 1
+        stats["rows"] += max(cursor.rowcount, 0)
+
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    try:
+        with Session(engine) as session:
+            start = time.perf_counter()
+            devices = session.execute(query).unique().scalars().all()
+            stats["ms"] = (time.perf_counter() - start) * 1000
+            stats["devices"] = len(devices)
+            stats["prices"] = sum(len(device.prices) for device in devices)
+    finally:
+        event.remove(engine, "after_cursor_execute", after_cursor_execute)
+
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("url", help="Synchronous database URL")
+    parser.add_argument("--org", type=UUID, required=True)
+    parser.add_argument("--limit", type=int, default=1000)
+    args = parser.parse_args()
+
+    bootstrap()
+    engine = create_engine(args.url)
+
+    query = (
+        select(Device)
+        .where(Device.id_org == args.org)
+        .order_by(Device.id)
+        .limit(args.limit)
+    )
+    cases = {
+        "joined (before)": query.options(joinedload(Device.prices)),
+        "selectin (after)": query,
+    }
+
+    print(
+        f"{'case':<18} {'devices':>8} {'prices':>7} {'stmts':>6} {'rows':>8} {'ms':>9}"
+    )
+    for name, case in cases.items():
+        stats = run(engine, case)
+        print(
+            f"{name:<18} {stats['devices']:>8} {stats['prices']:>7} "
+            f"{stats['statements']:>6} {stats['rows']:>8} {stats['ms']:>9.1f}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Import-time report for the model modules.
+
+Each module is imported in a fresh interpreter with `-X importtime`, so the
+numbers are cold-start costs and include everything the module drags in.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-ms 300 common_models.models.device.model
+"""
+
+import argparse
+import pkgutil
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def model_modules() -> list[str]:
+    import common_models.models
+
+    return sorted(
+        module.name
+        for module in pkgutil.walk_packages(
+            common_models.models.__path__, "common_models.models."
+        )
+        if not module.ispkg
+    )
+
+
+def measure(module: str) -> dict:
+    # Dependencies (pydantic, sqlalchemy, ...) are preloaded so only the
+    # package's own modules are counted against the budget.
+    code = f"import sqlmodel, fastapi, fastapi_async_sqlalchemy; import {module}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match and match.group(4).startswith("common_models"):
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+
+    error = None
+    if proc.returncode:
+        error = proc.stderr.strip().splitlines()[-1]
+
+    return {
+        "module": module,
+        "cumulative_us": modules.get(module, (0, 0))[1],
+        "package_modules": len(modules),
+        "self_us": sorted(modules.items(), key=lambda item: -item[1][0]),
+        "error": error,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="Modules to measure (default: all)")
+    parser.add_argument("--budget-ms", type=float, help="Fail above this cost")
+    parser.add_argument("--top", type=int, default=3, help="Heaviest modules to list")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules or model_modules():
+        result = measure(module)
+        if result["error"]:
+            print(f"{module:<65} ERROR {result['error']}")
+            failed = True
+            continue
+
+        cost_ms = result["cumulative_us"] / 1000
+        over = args.budget_ms is not None and cost_ms > args.budget_ms
+        failed = failed or over
+
+        print(
+            f"{module:<65} {cost_ms:8.1f} ms  "
+            f"{result['package_modules']:3d} modules{'  OVER BUDGET' if over else ''}"
+        )
+        for name, (self_us, _) in result["self_us"][: args.top]:
+            print(f"    {name:<61} {self_us / 1000:8.1f} ms self")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
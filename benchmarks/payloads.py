@@ -0,0 +1,259 @@
+"""
+Realistic, deterministic payloads for the Read model benchmarks.
+
+Values have the types rows come back with from the database (UUID,
+aware datetime, Decimal, plain strings for enums), so validation does
+the same coercions it does in production.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class Payloads:
+    def __init__(self, seed: int = 0):
+        self.random = random.Random(seed)
+
+    def uuid(self) -> UUID:
+        return UUID(int=self.random.getrandbits(128), version=4)
+
+    def timestamp(self) -> datetime:
+        return EPOCH + timedelta(seconds=self.random.randrange(0, 365 * 86400))
+
+    def money(self, high: int = 200) -> Decimal:
+        return Decimal(self.random.randrange(100, high * 100)) / 100
+
+    def price(self) -> dict:
+        return {
+            "id": self.uuid(),
+            "created_at": self.timestamp(),
+            "name": f"Hourly {self.random.randrange(1, 20)}",
+            "amount": self.money(),
+            "currency": "usd",
+            "prorated": False,
+            "default": False,
+            "card_on_file": True,
+            "unit": "hour",
+            "unit_amount": Decimal("1.00"),
+            "price_type": "pay_per_time",
+        }
+
+    def size(self) -> dict:
+        return {
+            "id": self.uuid(),
+            "created_at": self.timestamp(),
+            "name": self.random.choice(["Small", "Medium", "Large"]),
+            "external_id": None,
+            "description": "Standard locker",
+            "image": "https://koloni-org-data.s3.amazonaws.com/size.png",
+            "width": Decimal("12.0000"),
+            "depth": Decimal("18.5000"),
+            "height": Decimal("24.0000"),
+        }
+
+    def product(self) -> dict:
+        return {
+            "id": self.uuid(),
+            "created_at": self.timestamp(),
+            "image": None,
+            "name": "Umbrella",
+            "description": "Compact travel umbrella",
+            "price": self.money(50),
+            "sales_price": None,
+            "sku": "UMB-01",
+            "msrp": "25",
+            "serial_number": str(self.random.randrange(10**9)),
+            "condition": "new",
+            "repair_on_broken": False,
+            "report_on_broken": True,
+        }
+
+    def location(self, devices: list | None = None) -> dict:
+        location = {
+            "id": self.uuid(),
+            "created_at": self.timestamp(),
+            "id_org": self.uuid(),
+            "name": f"Location {self.random.randrange(1000)}",
+            "custom_id": None,
+            "address": "100 Main St, Springfield",
+            "image": None,
+            "hidden": False,
+            "shared": False,
+            "latitude": Decimal("40.712775800000000"),
+            "longitude": Decimal("-74.005972800000000"),
+            "contact_email": "ops@example.com",
+            "contact_phone": "+15555550100",
+            "restrict_by_user_code": False,
+            "verify_pin_code": True,
+            "verify_qr_code": False,
+            "verify_url": False,
+            "verify_signature": False,
+            "email": False,
+            "phone": True,
+            "available_devices": self.random.randrange(50),
+            "reserved_devices": self.random.randrange(50),
+            "maintenance_devices": self.random.randrange(5),
+            "price": self.price(),
+        }
+        if devices is not None:
+            location["devices"] = devices
+        return location
+
+    def device(self, nested: bool = True) -> dict:
+        hardware_type = self.random.choice(["linka", "ojmar", "kerong"])
+        device = {
+            "id": self.uuid(),
+            "created_at": self.timestamp(),
+            "name": f"Locker {self.random.randrange(1, 500)}",
+            "custom_identifier": None,
+            "item": None,
+            "item_description": None,
+            "image": None,
+            "locker_number": self.random.randrange(1, 500),
+            "mode": "rental",
+            "shared": False,
+            "require_image": False,
+            "status": self.random.choice(["available", "reserved", "maintenance"]),
+            "hardware_type": hardware_type,
+            "mac_address": None,
+            "integration_id": None,
+            "locker_udn": None,
+            "user_code": None,
+            "master_code": None,
+            "gantner_id": None,
+            "keynius_id": None,
+            "harbor_tower_id": None,
+            "harbor_locker_id": None,
+            "circuit_unit": None,
+            "board_unit": None,
+            "hook_port": None,
+            "ip": None,
+            "additional_metadata": None,
+            "dclock_terminal_no": None,
+            "dclock_box_no": None,
+            "price_required": True,
+            "lock_status": "locked",
+            "id_location": self.uuid(),
+            "id_size": self.uuid(),
+            "id_price": self.uuid(),
+            "id_product": None,
+        }
+
+        if hardware_type == "linka":
+            device["mac_address"] = ":".join(
+                f"{self.random.randrange(256):02X}" for _ in range(6)
+            )
+        elif hardware_type == "ojmar":
+            device["locker_udn"] = str(self.random.randrange(10**12))
+            device["user_code"] = f"{self.random.randrange(10000):04d}"
+            device["master_code"] = f"{self.random.randrange(10**6):06d}"
+        else:
+            device["ip"] = (
+                f"10.0.{self.random.randrange(256)}.{self.random.randrange(256)}"
+            )
+            device["hook_port"] = 4001
+            device["circuit_unit"] = "1"
+            device["board_unit"] = str(self.random.randrange(1, 24))
+            device["additional_metadata"] = '{"firmware": "2.3.1"}'
+
+        if nested:
+            device["location"] = self.location()
+            device["size"] = self.size()
+            device["price"] = self.price()
+            device["product"] = self.product() if self.random.random() < 0.2 else None
+            device["prices"] = [self.price() for _ in range(self.random.randrange(4))]
+        return device
+
+    def user(self) -> dict:
+        return {
+            "id": self.uuid(),
+            "created_at": self.timestamp(),
+            "name": "Jordan",
+            "last_name": "Doe",
+            "phone_number": "+15555550123",
+            "email": "jordan@example.com",
+            "active": True,
+            "user_id": None,
+            "pin_code": f"{self.random.randrange(10000):04d}",
+            "access_code": None,
+            "address": None,
+            "require_auth": False,
+            "groups": [],
+            "is_deleted": False,
+        }
+
+    def promo(self) -> dict:
+        return {
+            "id": self.uuid(),
+            "created_at": self.timestamp(),
+            "name": "Spring sale",
+            "code": "SPRING",
+            "amount": Decimal("10.00"),
+            "discount_type": "percentage",
+            "start_time": self.timestamp(),
+            "end_time": self.timestamp(),
+        }
+
+    def membership(self) -> dict:
+        return {
+            "id": self.uuid(),
+            "created_at": self.timestamp(),
+            "expiration_date": None,
+            "name": "Monthly unlimited",
+            "description": "Unlimited rentals",
+            "active": True,
+            "currency": "usd",
+            "amount": Decimal("29.99"),
+            "billing_type": "recurring",
+            "billing_period": "month",
+            "number_of_payments": 0,
+            "membership_type": "unlimited",
+            "value": Decimal("0.00"),
+            "stripe_product_id": "prod_123",
+            "stripe_price_id": "price_123",
+            "locations": [],
+            "users": [],
+        }
+
+    def event(self) -> dict:
+        started_at = self.timestamp()
+        return {
+            "id": self.uuid(),
+            "invoice_id": f"INV-{self.random.randrange(10**6):06d}",
+            "order_id": None,
+            "code": self.random.randrange(10**6),
+            "created_at": started_at,
+            "started_at": started_at,
+            "ended_at": started_at + timedelta(hours=2),
+            "canceled_at": None,
+            "event_status": "finished",
+            "event_type": "rental",
+            "harbor_session_seed": None,
+            "harbor_session_token": None,
+            "harbor_session_token_auth": None,
+            "harbor_payload": None,
+            "harbor_payload_auth": None,
+            "harbor_reservation_id": None,
+            "image_url": "https://koloni-org-data.s3.amazonaws.com/event.png",
+            "total": self.money(),
+            "total_time": "2:00:00",
+            "weight": None,
+            "refunded_amount": Decimal("0.00"),
+            "penalize_charge": None,
+            "penalize_reason": None,
+            "courier_pin_code": None,
+            "canceled_by": None,
+            "signature_url": None,
+            "id_user": self.uuid(),
+            "id_device": self.uuid(),
+            "device": self.device(),
+            "user": self.user(),
+            "promo": self.promo() if self.random.random() < 0.3 else None,
+            "membership": self.membership() if self.random.random() < 0.3 else None,
+            "notification_status": "sent",
+            "notification_status_date": started_at,
+        }
@@ -0,0 +1,3 @@
+from common_models._bootstrap import BootstrapError, BootstrapReport, bootstrap
+
+__all__ = ["BootstrapError", "BootstrapReport", "bootstrap"]
@@ -0,0 +1,142 @@
+import importlib
+import logging
+import sys
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, configure_mappers
+from sqlmodel import SQLModel
+
+from common_models.models import _MODELS
+
+logger = logging.getLogger(__name__)
+
+
+class BootstrapError(RuntimeError):
+    pass
+
+
+class ModelTiming(BaseModel):
+    name: str
+    module: str
+    import_ms: float = 0
+    configure_ms: float = 0
+
+
+class BootstrapReport(BaseModel):
+    import_ms: float
+    configure_ms: float
+    total_ms: float
+    tables: int
+    models: list[ModelTiming]
+
+
+_report: Optional[BootstrapReport] = None
+
+
+def _import_models() -> dict[str, ModelTiming]:
+    timings = {}
+
+    for name, module in sorted(_MODELS.items()):
+        timing = ModelTiming(name=name, module=module)
+        if module not in sys.modules:
+            start = time.perf_counter()
+            importlib.import_module(module)
+            timing.import_ms = (time.perf_counter() - start) * 1000
+        timings[name] = timing
+
+    return timings
+
+
+def _configure(timings: dict[str, ModelTiming]) -> None:
+    last = time.perf_counter()
+
+    def mapper_configured(mapper: Mapper, class_: type) -> None:
+        nonlocal last
+        now = time.perf_counter()
+        if class_.__name__ in timings:
+            timings[class_.__name__].configure_ms = (now - last) * 1000
+        last = now
+
+    event.listen(Mapper, "mapper_configured", mapper_configured)
+    try:
+        configure_mappers()
+    finally:
+        event.remove(Mapper, "mapper_configured", mapper_configured)
+
+
+def _back_populates_errors() -> list[str]:
+    errors = []
+
+    for mapper in SQLModel._sa_registry.mappers:
+        for prop in mapper.relationships:
+            if not prop.back_populates:
+                continue
+
+            name = f"{mapper.class_.__name__}.{prop.key}"
+            other = prop.mapper.relationships.get(prop.back_populates)
+            if other is None:
+                errors.append(
+                    f"{name} back_populates missing "
+                    f"{prop.mapper.class_.__name__}.{prop.back_populates}"
+                )
+            elif other.back_populates != prop.key or other.mapper is not mapper:
+                errors.append(
+                    f"{name} back_populates "
+                    f"{prop.mapper.class_.__name__}.{other.key}, which points to "
+                    f"{other.mapper.class_.__name__}.{other.back_populates}"
+                )
+
+    return errors
+
+
+def bootstrap(force: bool = False) -> BootstrapReport:
+    """
+    Import every table model, configure all mappers and check that each
+    back_populates pair points at itself.
+
+    Meant to run once per process before serving, e.g. in a gunicorn
+    `preload_app` hook so the work is shared by the forked workers.
+    """
+    global _report
+    if _report and not force:
+        return _report
+
+    start = time.perf_counter()
+    timings = _import_models()
+    imported = time.perf_counter()
+
+    _configure(timings)
+    configured = time.perf_counter()
+
+    errors = _back_populates_errors()
+    if errors:
+        raise BootstrapError(
+            "Invalid back_populates pairs:\n" + "\n".join(f"  {e}" for e in errors)
+        )
+
+    _report = BootstrapReport(
+        import_ms=(imported - start) * 1000,
+        configure_ms=(configured - imported) * 1000,
+        total_ms=(time.perf_counter() - start) * 1000,
+        tables=len(SQLModel.metadata.tables),
+        models=sorted(timings.values(), key=lambda t: -(t.import_ms + t.configure_ms)),
+    )
+
+    for timing in _report.models:
+        logger.info(
+            "bootstrap model=%s import_ms=%.2f configure_ms=%.2f",
+            timing.name,
+            timing.import_ms,
+            timing.configure_ms,
+        )
+    logger.info(
+        "bootstrap tables=%d import_ms=%.2f configure_ms=%.2f total_ms=%.2f",
+        _report.tables,
+        _report.import_ms,
+        _report.configure_ms,
+        _report.total_ms,
+    )
+    return _report
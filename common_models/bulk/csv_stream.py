@@ -0,0 +1,80 @@
+"""
+Lazy, chunked reading and validation of bulk upload CSVs.
+
+Rows are read a chunk at a time from any iterable of lines (an open file,
+a decoded upload stream, ...), so memory stays bounded by the chunk size
+no matter how long the file is. Row numbers are the file's line numbers,
+the header being line 1.
+"""
+
+import csv
+from typing import IO, Iterable, Iterator, Optional, TypeVar, Union
+
+from pydantic import BaseModel, ValidationError
+
+CHUNK_SIZE = 1000
+
+Row = TypeVar("Row", bound=BaseModel)
+
+
+class RowError(BaseModel):
+    row: int
+    field: Optional[str]
+    message: str
+
+
+def _normalize_header(name: str) -> str:
+    return name.strip().lower().replace(" ", "_")
+
+
+def read_rows(lines: Union[IO[str], Iterable[str]]) -> Iterator[tuple[int, dict]]:
+    """
+    Yield (row number, {column: value}) with normalized headers. Blank
+    cells are left out, so the row model's defaults apply to them.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    columns = [_normalize_header(name) for name in header]
+
+    for cells in reader:
+        if not any(cell.strip() for cell in cells):
+            continue
+        yield reader.line_num, {
+            column: cell.strip() for column, cell in zip(columns, cells) if cell.strip()
+        }
+
+
+def read_chunks(
+    lines: Union[IO[str], Iterable[str]], size: int = CHUNK_SIZE
+) -> Iterator[list[tuple[int, dict]]]:
+    chunk = []
+    for row in read_rows(lines):
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate_chunk(
+    model: type[Row], chunk: list[tuple[int, dict]]
+) -> tuple[list[tuple[int, Row]], list[RowError]]:
+    valid, errors = [], []
+
+    for line, data in chunk:
+        try:
+            valid.append((line, model.parse_obj(data)))
+        except ValidationError as e:
+            errors.extend(
+                RowError(
+                    row=line,
+                    field=".".join(str(part) for part in error["loc"]),
+                    message=error["msg"],
+                )
+                for error in e.errors()
+            )
+
+    return valid, errors
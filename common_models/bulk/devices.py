@@ -0,0 +1,151 @@
+"""
+Streaming ingestion of `Device.WriteCSV` uploads.
+
+    async with db():
+        report = await ingest_devices(id_org, upload.file)
+        await db.session.commit()
+
+The CSV is read and validated one chunk at a time, in a process pool for
+large files (see `common_models.bulk.parallel`). Location, size, price,
+product and group names are resolved in memory by a `NameResolver` loaded
+once per upload, and each chunk is written with `COPY` (see
+`common_models.bulk.writer`) for devices and then for group links, so
+memory stays flat however large the file is. Rows that fail validation,
+name a missing or ambiguous record or reuse a mac_address are reported
+and skipped. COPY bypasses the ORM, so the location device counters are
+updated here for the rows written; the caller owns the transaction.
+"""
+
+import asyncio
+import json
+from typing import IO, Iterable, Optional, Union
+from uuid import UUID, uuid4
+
+from fastapi_async_sqlalchemy import db
+from pydantic import BaseModel
+
+from common_models import models
+from common_models.bulk.csv_stream import CHUNK_SIZE, RowError
+from common_models.bulk.parallel import PARALLEL_THRESHOLD, validate_parallel
+from common_models.bulk.resolver import DEVICE_NAMES, NameResolver
+from common_models.bulk.writer import write_rows, written_ids
+from common_models.models.device.model import Device
+from common_models.models.location.device_count import count_deltas, counts_upsert
+
+# CSV column: Device column it resolves to
+FOREIGN_KEYS = {
+    "location": "id_location",
+    "size": "id_size",
+    "price": "id_price",
+    "product": "id_product",
+}
+
+UNIQUE_COLUMNS = ("mac_address",)
+
+
+class IngestReport(BaseModel):
+    rows: int = 0
+    inserted: int = 0
+    errors: list[RowError] = []
+
+
+def _device_row(id_org: UUID, record: Device.WriteCSV) -> dict:
+    row = record.dict(exclude=set(DEVICE_NAMES))
+
+    if isinstance(row["additional_metadata"], str):
+        try:
+            row["additional_metadata"] = json.loads(row["additional_metadata"])
+        except json.JSONDecodeError:
+            raise ValueError("additional_metadata must be a valid JSON string")
+
+    row.update(
+        id=uuid4(),
+        id_org=id_org,
+        shared=False,
+        require_image=False,
+        price_required=bool(record.price_required),
+    )
+    return row
+
+
+def build_rows(
+    id_org: UUID,
+    records: list[tuple[int, Device.WriteCSV]],
+    resolver: NameResolver,
+) -> tuple[list[tuple[int, dict]], list[tuple[int, dict]], list[RowError]]:
+    devices, links = [], []
+    resolved, errors = resolver.resolve_all(records)
+
+    for line, record, ids in resolved:
+        try:
+            row = _device_row(id_org, record)
+        except ValueError as e:
+            errors.append(
+                RowError(row=line, field="additional_metadata", message=str(e))
+            )
+            continue
+
+        for column, field in FOREIGN_KEYS.items():
+            row[field] = ids.get(column)
+        devices.append((line, row))
+
+        if "group" in ids:
+            links.append(
+                (
+                    line,
+                    {"id": uuid4(), "id_group": ids["group"], "id_device": row["id"]},
+                )
+            )
+
+    return devices, links, errors
+
+
+async def ingest_devices(
+    id_org: UUID,
+    lines: Union[IO[str], Iterable[str]],
+    chunk_size: int = CHUNK_SIZE,
+    workers: Optional[int] = None,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> IngestReport:
+    """
+    Shards are validated off the event loop; files of `threshold` rows or
+    more go through a pool of `workers` processes.
+    """
+    report = IngestReport()
+    resolver = NameResolver(DEVICE_NAMES)
+    await resolver.load(id_org)
+
+    shards = validate_parallel(
+        Device.WriteCSV, lines, chunk_size, workers=workers, threshold=threshold
+    )
+    try:
+        while shard := await asyncio.to_thread(next, shards, None):
+            rows, records, errors = shard
+            report.rows += rows
+
+            devices, links, build_errors = build_rows(id_org, records, resolver)
+            report.errors.extend(errors + build_errors)
+
+            if not devices:
+                continue
+
+            written = await write_rows(Device.__table__, devices, unique=UNIQUE_COLUMNS)
+            report.inserted += written.inserted
+            report.errors.extend(written.conflicts)
+
+            ids = written_ids(devices, written)
+            counts = counts_upsert(
+                count_deltas(row for _, row in devices if row["id"] in ids)
+            )
+            if counts is not None:
+                await db.session.execute(counts)
+
+            links = [(line, link) for line, link in links if link["id_device"] in ids]
+            if links:
+                await write_rows(models.LinkGroupsDevices.__table__, links)
+    finally:
+        # Shuts the worker pool down; that joins processes, so off the loop.
+        await asyncio.to_thread(shards.close)
+
+    report.errors.sort(key=lambda error: error.row)
+    return report
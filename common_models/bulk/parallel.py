@@ -0,0 +1,77 @@
+"""
+Optional multi-process validation of large uploads.
+
+    for rows, records, errors in validate_parallel(Device.WriteCSV, upload.file):
+        ...
+
+The CSV is cut into shards of consecutive rows, and each shard is
+validated in a worker process. Results come back in the original row
+order. At most a few shards per worker are in flight, so memory stays
+bounded like the in-process path. Files under `threshold` rows are
+validated in-process, where starting a pool costs more than it saves.
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from pydantic import BaseModel
+
+from common_models.bulk.csv_stream import RowError, read_chunks, validate_chunk
+
+SHARD_SIZE = 2000
+PARALLEL_THRESHOLD = 20_000
+
+Validated = tuple[int, list[tuple[int, BaseModel]], list[RowError]]
+
+
+def _validate_shard(model: type[BaseModel], shard: list[tuple[int, dict]]) -> Validated:
+    records, errors = validate_chunk(model, shard)
+    return len(shard), records, errors
+
+
+def validate_parallel(
+    model: type[BaseModel],
+    lines: Union[IO[str], Iterable[str]],
+    shard_size: int = SHARD_SIZE,
+    workers: Optional[int] = None,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> Iterator[Validated]:
+    """
+    Yield (rows read, valid records, errors) per shard, in file order
+    """
+    validate = partial(_validate_shard, model)
+    shards = read_chunks(lines, shard_size)
+
+    buffered, rows = [], 0
+    for shard in shards:
+        buffered.append(shard)
+        rows += len(shard)
+        if rows >= threshold:
+            break
+    else:
+        yield from map(validate, buffered)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    # Spawned, not forked: callers run this next to an event loop, threads
+    # and open database connections that a forked child would inherit.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        pending = deque()
+        try:
+            for shard in chain(buffered, shards):
+                pending.append(executor.submit(validate, shard))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Closed early: drop queued shards so shutdown only waits for
+            # the ones already running.
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,47 @@
+"""
+Row building for `Reservation.WriteCSV` uploads.
+
+Location and size names go through the same `NameResolver` as device
+uploads:
+
+    resolver = NameResolver(RESERVATION_NAMES)
+    await resolver.load(id_org)
+    for chunk in read_chunks(upload.file):
+        records, errors = validate_chunk(Reservation.WriteCSV, chunk)
+        rows, build_errors = build_rows(id_org, records, resolver)
+        # set id_user on each row, then
+        report = await write_rows(Reservation.__table__, rows)
+
+The recipient columns (user_name, phone_number, email) are not reservation
+columns; the caller matches them to a user and sets `id_user` itself.
+"""
+
+from typing import Any
+from uuid import UUID, uuid4
+
+from common_models.bulk.csv_stream import RowError
+from common_models.bulk.resolver import NameResolver
+
+RECIPIENT_COLUMNS = {"user_name", "phone_number", "email"}
+
+
+def _reservation_row(id_org: UUID, record: Any, ids: dict[str, UUID]) -> dict:
+    row = record.dict(exclude=RECIPIENT_COLUMNS | {"location", "size"})
+    row.update(
+        id=uuid4(),
+        id_org=id_org,
+        id_location=ids.get("location"),
+        id_size=ids.get("size"),
+        started=False,
+    )
+    return row
+
+
+def build_rows(
+    id_org: UUID, records: list[tuple[int, Any]], resolver: NameResolver
+) -> tuple[list[tuple[int, dict]], list[RowError]]:
+    resolved, errors = resolver.resolve_all(records)
+    rows = [
+        (line, _reservation_row(id_org, record, ids)) for line, record, ids in resolved
+    ]
+    return rows, errors
@@ -0,0 +1,112 @@
+"""
+Bulk name-to-id resolution for the name columns of CSV uploads.
+
+    resolver = NameResolver(DEVICE_NAMES)
+    await resolver.load(id_org)
+    ids, errors = resolver.resolve(line, record)
+
+`load()` reads every candidate name of the org with one query per target
+table into a hash index keyed on the case- and whitespace-normalized name,
+after which a whole upload resolves in memory. Names that match nothing,
+or more than one record, are reported with the row they came from.
+"""
+
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi_async_sqlalchemy import db
+from sqlalchemy import select
+
+from common_models import models
+from common_models.bulk.csv_stream import RowError
+
+# CSV column: model name in common_models.models
+DEVICE_NAMES = {
+    "location": "Location",
+    "size": "Size",
+    "price": "Price",
+    "product": "Product",
+    "group": "Groups",
+}
+RESERVATION_NAMES = {
+    "location": "Location",
+    "size": "Size",
+}
+
+
+def normalize_name(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+class NameResolver:
+    def __init__(self, targets: dict[str, str]):
+        self.targets = targets
+        self.index: dict[str, dict[str, list[UUID]]] = {}
+
+    def add(self, column: str, id: UUID, name: Optional[str]):
+        if name is not None:
+            self.index.setdefault(column, {}).setdefault(
+                normalize_name(name), []
+            ).append(id)
+
+    async def load(self, id_org: UUID):
+        self.index = {column: {} for column in self.targets}
+
+        for column, model_name in self.targets.items():
+            model = getattr(models, model_name)
+            result = await db.session.execute(
+                select(model.id, model.name).where(model.id_org == id_org)
+            )
+            for id, name in result.all():
+                self.add(column, id, name)
+
+    def lookup(self, column: str, name: str) -> list[UUID]:
+        return self.index.get(column, {}).get(normalize_name(name), [])
+
+    def resolve(self, line: int, record: Any) -> tuple[dict[str, UUID], list[RowError]]:
+        """
+        Resolve the name columns of one validated row
+        """
+        ids, errors = {}, []
+
+        for column in self.targets:
+            name = getattr(record, column, None)
+            if name is None:
+                continue
+
+            matches = self.lookup(column, name)
+            if len(matches) == 1:
+                ids[column] = matches[0]
+            elif not matches:
+                errors.append(
+                    RowError(
+                        row=line, field=column, message=f"Unknown {column}: {name}"
+                    )
+                )
+            else:
+                errors.append(
+                    RowError(
+                        row=line,
+                        field=column,
+                        message=f"Ambiguous {column}: {name} matches {len(matches)} records",
+                    )
+                )
+
+        return ids, errors
+
+    def resolve_all(
+        self, records: list[tuple[int, Any]]
+    ) -> tuple[list[tuple[int, Any, dict[str, UUID]]], list[RowError]]:
+        """
+        Resolve a batch, keeping only the rows whose names all resolved
+        """
+        resolved, errors = [], []
+
+        for line, record in records:
+            ids, row_errors = self.resolve(line, record)
+            if row_errors:
+                errors.extend(row_errors)
+            else:
+                resolved.append((line, record, ids))
+
+        return resolved, errors
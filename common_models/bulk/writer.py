@@ -0,0 +1,206 @@
+"""
+Bulk writer for validated upload rows.
+
+    report = await write_rows(Device.__table__, rows, unique=("mac_address",))
+
+Rows are (row number, {column: value}) pairs as built by the upload
+modules. They are streamed with `COPY ... FROM STDIN` through the session's
+asyncpg connection, inside a savepoint; on other drivers, or if the COPY
+hits a conflict that appeared after the pre-check, the batch is written
+with multi-row `INSERT ... ON CONFLICT DO NOTHING RETURNING id` instead.
+
+Python-side column defaults are filled in here, and columns with a server
+default (`current_timestamp`) are left out of the COPY so PostgreSQL fills
+them. Ids are generated client-side so dependent rows (group links) can be
+written in the same batch. Rows whose `unique` values are already taken,
+in the table or earlier in the batch, are reported as conflicts and
+skipped.
+"""
+
+from typing import Iterable, Optional
+from uuid import uuid4
+
+from fastapi_async_sqlalchemy import db
+from pydantic import BaseModel
+from sqlalchemy import Table, select
+from sqlalchemy.dialects.postgresql import insert
+
+from common_models.bulk.csv_stream import RowError
+
+try:
+    from asyncpg import PostgresError
+except ImportError:  # pragma: no cover
+    PostgresError = ()
+
+# asyncpg binds at most 32767 parameters per statement.
+MAX_PARAMETERS = 32767
+
+
+class WriteReport(BaseModel):
+    inserted: int = 0
+    conflicts: list[RowError] = []
+    method: Optional[str]
+
+
+def _copy_columns(table: Table, rows: list[dict]) -> list[str]:
+    present = set().union(*rows)
+    return [
+        column.name
+        for column in table.columns
+        if column.name in present or column.server_default is None
+    ]
+
+
+def _fill_defaults(table: Table, columns: list[str], row: dict) -> dict:
+    for name in columns:
+        if name in row:
+            continue
+        default = table.columns[name].default
+        if default is not None and default.is_scalar:
+            row[name] = default.arg
+        elif default is not None and default.is_callable:
+            row[name] = default.arg(None)
+        else:
+            row[name] = None
+    return row
+
+
+async def _taken(table: Table, unique: Iterable[str], rows: list[dict]) -> dict:
+    """
+    Values of `unique` columns already stored, per column
+    """
+    taken = {}
+    for name in unique:
+        values = {row[name] for row in rows if row.get(name) is not None}
+        if not values:
+            taken[name] = set()
+            continue
+        column = table.columns[name]
+        result = await db.session.execute(select(column).where(column.in_(values)))
+        taken[name] = set(result.scalars().all())
+    return taken
+
+
+async def precheck_conflicts(
+    table: Table, rows: list[tuple[int, dict]], unique: Iterable[str]
+) -> tuple[list[tuple[int, dict]], list[RowError]]:
+    unique = tuple(unique)
+    taken = await _taken(table, unique, [row for _, row in rows])
+    accepted, conflicts = [], []
+
+    for line, row in rows:
+        clashes = [
+            name
+            for name in unique
+            if row.get(name) is not None and row[name] in taken[name]
+        ]
+        if clashes:
+            conflicts.extend(
+                RowError(
+                    row=line, field=name, message=f"{name} already in use: {row[name]}"
+                )
+                for name in clashes
+            )
+            continue
+        for name in unique:
+            if row.get(name) is not None:
+                taken[name].add(row[name])
+        accepted.append((line, row))
+
+    return accepted, conflicts
+
+
+async def _driver_connection():
+    connection = await db.session.connection()
+    raw = await connection.get_raw_connection()
+    return connection.dialect, raw.driver_connection
+
+
+async def _copy(table: Table, columns: list[str], rows: list[dict]) -> bool:
+    dialect, driver = await _driver_connection()
+    if not hasattr(driver, "copy_records_to_table"):
+        return False
+
+    processors = [
+        table.columns[name].type._cached_bind_processor(dialect) for name in columns
+    ]
+    records = [
+        tuple(
+            value if process is None or value is None else process(value)
+            for process, value in zip(processors, (row[name] for name in columns))
+        )
+        for row in rows
+    ]
+
+    try:
+        async with db.session.begin_nested():
+            await driver.copy_records_to_table(
+                table.name, records=records, columns=columns, schema_name=table.schema
+            )
+    except PostgresError:
+        return False
+    return True
+
+
+async def _insert(table: Table, columns: list[str], rows: list[dict]) -> set:
+    inserted = set()
+    size = max(1, MAX_PARAMETERS // len(columns))
+
+    for start in range(0, len(rows), size):
+        batch = [
+            {name: row[name] for name in columns} for row in rows[start : start + size]
+        ]
+        result = await db.session.execute(
+            insert(table).values(batch).on_conflict_do_nothing().returning(table.c.id)
+        )
+        inserted.update(result.scalars().all())
+
+    return inserted
+
+
+async def write_rows(
+    table: Table,
+    rows: list[tuple[int, dict]],
+    unique: Iterable[str] = (),
+    copy: bool = True,
+) -> WriteReport:
+    unique = tuple(unique)
+    accepted, conflicts = await precheck_conflicts(table, rows, unique)
+    report = WriteReport(conflicts=conflicts)
+    if not accepted:
+        return report
+
+    for _, row in accepted:
+        row.setdefault("id", uuid4())
+    columns = _copy_columns(table, [row for _, row in accepted])
+    values = [_fill_defaults(table, columns, row) for _, row in accepted]
+
+    if copy and await _copy(table, columns, values):
+        report.method = "copy"
+        report.inserted = len(values)
+        return report
+
+    # Without COPY, or when it hit a row claimed since the pre-check; such
+    # rows are skipped by ON CONFLICT and reported from the RETURNING ids.
+    inserted = await _insert(table, columns, values)
+    report.method = "insert"
+    report.inserted = len(inserted)
+    report.conflicts.extend(
+        RowError(
+            row=line,
+            field=", ".join(unique) or None,
+            message="Row conflicts with an existing record",
+        )
+        for line, row in accepted
+        if row["id"] not in inserted
+    )
+    report.conflicts.sort(key=lambda error: error.row)
+    return report
+
+
+def written_ids(rows: list[tuple[int, dict]], report: WriteReport) -> set:
+    """
+    Ids of the rows `write_rows` stored, for filtering dependent rows
+    """
+    skipped = {error.row for error in report.conflicts}
+    return {row["id"] for line, row in rows if line not in skipped}
@@ -0,0 +1,126 @@
+"""
+Lazy access to the table models.
+
+`from common_models.models import Device` imports only the module that
+defines Device. Relationships still name their targets as strings
+("Location", "Event", ...); the modules behind those names are imported
+right before SQLAlchemy configures the mappers, so a worker that only
+touches a few models does not build the whole class graph at import time.
+Model modules import each other only for schemas they use at runtime
+(nested Read models, enums, link tables); relationship-only targets are
+imported under TYPE_CHECKING, and helper modules on use.
+"""
+
+import importlib
+import sys
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+from sqlalchemy.orm.relationships import RelationshipProperty
+from sqlmodel import SQLModel
+
+_MODELS = {
+    "ApiKey": "common_models.models.developer.model",
+    "CognitoMembersRoleLink": "common_models.models.member.model",
+    "Codes": "common_models.models.user.model",
+    "Condition": "common_models.models.conditions.model",
+    "ConditionProductLink": "common_models.models.conditions.link_product_condition",
+    "Device": "common_models.models.device.model",
+    "Event": "common_models.models.event.model",
+    "Groups": "common_models.models.groups.model",
+    "HarborEvents": "common_models.models.harbor.model",
+    "Issue": "common_models.models.issue.model",
+    "KioskSettings": "common_models.models.settings.model",
+    "LinkDevicePrice": "common_models.models.device.link_device_price",
+    "LinkGroupsDevices": "common_models.models.groups.model",
+    "LinkGroupsLocations": "common_models.models.groups.model",
+    "LinkGroupsUser": "common_models.models.groups.model",
+    "LinkLocationOrgShared": "common_models.models.LinkLocationOrgShared.model",
+    "LinkMemberLocation": "common_models.models.member.model",
+    "LinkMembershipLocation": "common_models.models.memberships.link_membership_location",
+    "LinkNotificationLocation": "common_models.models.notifications.link_notification_location",
+    "LinkOrgUser": "common_models.models.organization.model",
+    "LinkUserDevices": "common_models.models.groups.model",
+    "LinkUserLocations": "common_models.models.groups.model",
+    "LiteAppSettings": "common_models.models.settings.model",
+    "Location": "common_models.models.location.model",
+    "LocationDeviceCount": "common_models.models.location.device_count",
+    "LockerWall": "common_models.models.locker_wall.model",
+    "Log": "common_models.models.logger.model",
+    "Membership": "common_models.models.memberships.model",
+    "MobileVersion": "common_models.models.version.model",
+    "Notification": "common_models.models.notifications.model",
+    "Org": "common_models.models.organization.model",
+    "OrgFilters": "common_models.models.filters.model",
+    "OrgSettings": "common_models.models.settings.model",
+    "Price": "common_models.models.price.model",
+    "Product": "common_models.models.products.model",
+    "ProductGroup": "common_models.models.product_groups.model",
+    "ProductTracking": "common_models.models.product_tracking.product_tracking",
+    "Promo": "common_models.models.promo.model",
+    "Report": "common_models.models.reports.model",
+    "Reservation": "common_models.models.reservations.model",
+    "ReservationSettings": "common_models.models.reservations.model",
+    "ReservationWidgetSettings": "common_models.models.settings.model",
+    "Role": "common_models.models.member.model",
+    "RolePermission": "common_models.models.member.model",
+    "Size": "common_models.models.size.model",
+    "User": "common_models.models.user.model",
+    "Webhook": "common_models.models.webhook.model",
+    "WhiteLabel": "common_models.models.white_label.model",
+}
+
+# Model module: modules that register mapper events on its models. They are
+# imported with the relationship targets, once the model module is loaded.
+_EXTENSIONS = {
+    "common_models.models.device.model": (
+        "common_models.models.location.device_count",
+    ),
+}
+
+__all__ = sorted(_MODELS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_MODELS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_MODELS))
+
+
+def _unresolved_targets() -> set[str]:
+    registered = SQLModel._sa_registry._class_registry
+    targets = set()
+
+    for mapper in list(SQLModel._sa_registry.mappers):
+        for prop in mapper._props.values():
+            if not isinstance(prop, RelationshipProperty):
+                continue
+            if isinstance(prop.argument, str) and prop.argument not in registered:
+                targets.add(prop.argument)
+
+    return targets & set(_MODELS)
+
+
+def _import_extensions() -> None:
+    for module, extensions in _EXTENSIONS.items():
+        if module in sys.modules:
+            for extension in extensions:
+                importlib.import_module(extension)
+
+
+@event.listens_for(Mapper, "before_configured")
+def _import_relationship_targets() -> None:
+    targets = _unresolved_targets()
+    while targets:
+        for name in targets:
+            __getattr__(name)
+        targets = _unresolved_targets()
+    _import_extensions()
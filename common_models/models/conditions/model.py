@@ -6,9 +6,11 @@ from pydantic import BaseModel
 from sqlalchemy import Column, DateTime, func
 from sqlmodel import Field, Relationship, SQLModel
 
-from common_models.models.products.model import Product
 from common_models.models.conditions.link_product_condition import ConditionProductLink
 
+if TYPE_CHECKING:
+    from common_models.models.products.model import Product
+
 
 class Condition(SQLModel, table=True):
     __tablename__ = "condition"
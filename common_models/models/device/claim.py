@@ -0,0 +1,93 @@
+"""
+Concurrency-safe claiming of an available device.
+
+    device = await claim_device(id_location, id_size=start.id_size)
+    ...
+    await db.session.commit()
+
+The candidate row is selected with `FOR UPDATE OF device SKIP LOCKED`, so
+concurrent claims at the same location each lock a different device
+instead of queueing on, or both taking, the first one. The device's status
+is flipped through the ORM, so the status counters follow, and the row
+stays locked until the caller's transaction ends.
+
+The device is loaded with the "minimal" load profile, so touching any of
+its relationships raises. Callers that build `Device.Read` (or an event
+response) from it pass the loader options they need:
+
+    device = await claim_device(id_location, options=Device.load_profile("detail"))
+
+Joined relationships are only read, never locked: the lock is limited to
+the device row.
+"""
+
+from typing import Iterable, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException
+from fastapi_async_sqlalchemy import db
+from sqlalchemy import select
+
+from common_models.models.device.model import Device, HardwareType, Mode, Status
+
+
+def claim_query(
+    id_location: UUID,
+    id_size: Optional[UUID] = None,
+    mode: Optional[Mode] = None,
+    hardware_type: Optional[HardwareType] = None,
+    exclude: Iterable[UUID] = (),
+    options: Optional[Sequence] = None,
+):
+    if options is None:
+        options = Device.load_profile("minimal")
+    query = (
+        select(Device)
+        .options(*options)
+        .where(Device.id_location == id_location, Device.status == Status.available)
+    )
+    if id_size is not None:
+        query = query.where(Device.id_size == id_size)
+    if mode is not None:
+        query = query.where(Device.mode == mode)
+    if hardware_type is not None:
+        query = query.where(Device.hardware_type == hardware_type)
+
+    exclude = list(exclude)
+    if exclude:
+        query = query.where(Device.id.not_in(exclude))
+
+    # Lowest locker number first keeps assignments predictable for staff.
+    return (
+        query.order_by(Device.locker_number, Device.id)
+        .limit(1)
+        .with_for_update(skip_locked=True, of=Device)
+    )
+
+
+async def claim_device(
+    id_location: UUID,
+    id_size: Optional[UUID] = None,
+    mode: Optional[Mode] = None,
+    hardware_type: Optional[HardwareType] = None,
+    status: Status = Status.reserved,
+    exclude: Iterable[UUID] = (),
+    options: Optional[Sequence] = None,
+) -> Device:
+    """
+    Lock an available device matching the filters and set its status.
+    It is loaded with `options` (the "minimal" profile by default, under
+    which its relationships raise on access).
+    """
+    result = await db.session.execute(
+        claim_query(id_location, id_size, mode, hardware_type, exclude, options)
+    )
+    device = result.scalars().first()
+    if device is None:
+        raise HTTPException(
+            status_code=404, detail="No available device at this location"
+        )
+
+    device.status = status
+    await db.session.flush()
+    return device
@@ -0,0 +1,170 @@
+"""
+Device lookup for inbound hardware callbacks.
+
+    ref = await resolve_device_ref(HardwareType.harbor, harbor_tower_id=t, harbor_locker_id=l)
+    device = await resolve_device(HardwareType.ojmar, locker_udn=udn)
+
+Each vendor identifies a lock by its own key (`HARDWARE_KEYS`), all of
+them indexed on the device table.
+
+`resolve_device_ref()` answers the routing question a callback starts with
+(which device, org and location) from a bounded in-process LRU, so a hit
+makes no query. Entries are dropped when a Device's keys or routing
+columns change or it is deleted through the ORM, and expire after
+`CACHE_TTL` seconds to bound staleness from writes made elsewhere (other
+processes, bulk UPDATEs).
+
+`resolve_device()` loads the live row, with the "minimal" load profile,
+for callbacks that read or change its state. It is one indexed query and
+is not cached.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+from uuid import UUID
+
+from fastapi_async_sqlalchemy import db
+from sqlalchemy import event, inspect, select
+
+from common_models.models.device.model import Device, HardwareType
+
+HARDWARE_KEYS = {
+    HardwareType.linka: ("mac_address",),
+    HardwareType.kerong: ("mac_address",),
+    HardwareType.spintly: ("integration_id",),
+    HardwareType.ojmar: ("locker_udn",),
+    HardwareType.gantner: ("gantner_id",),
+    HardwareType.keynius: ("keynius_id",),
+    HardwareType.harbor: ("harbor_tower_id", "harbor_locker_id"),
+    HardwareType.dclock: ("dclock_terminal_no", "dclock_box_no"),
+}
+
+CACHE_SIZE = 10_000
+CACHE_TTL = 300
+
+
+class DeviceRef(NamedTuple):
+    id: UUID
+    id_org: UUID
+    id_location: Optional[UUID]
+    hardware_type: HardwareType
+
+
+# Columns whose change makes a cached DeviceRef wrong
+WATCHED_COLUMNS = frozenset(DeviceRef._fields).union(*HARDWARE_KEYS.values())
+
+CacheKey = tuple[HardwareType, tuple]
+
+# key -> (expires at, ref)
+_cache: "OrderedDict[CacheKey, tuple[float, DeviceRef]]" = OrderedDict()
+_keys_by_device: dict[UUID, set[CacheKey]] = {}
+
+
+def _cache_key(hardware_type: HardwareType, ids: dict[str, Any]) -> CacheKey:
+    try:
+        keys = HARDWARE_KEYS[hardware_type]
+    except KeyError:
+        raise ValueError(f"No hardware key for {hardware_type.value} devices")
+
+    if set(ids) != set(keys) or any(ids[key] is None for key in keys):
+        raise ValueError(
+            f"{hardware_type.value} devices are identified by {', '.join(keys)}"
+        )
+    return hardware_type, tuple(ids[key] for key in keys)
+
+
+def _drop(key: CacheKey):
+    _, ref = _cache.pop(key)
+    keys = _keys_by_device.get(ref.id)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del _keys_by_device[ref.id]
+
+
+def _remember(key: CacheKey, ref: DeviceRef):
+    if key in _cache:
+        _drop(key)
+    _cache[key] = (time.monotonic() + CACHE_TTL, ref)
+    _keys_by_device.setdefault(ref.id, set()).add(key)
+
+    while len(_cache) > CACHE_SIZE:
+        _drop(next(iter(_cache)))
+
+
+def forget_device(id: UUID):
+    for key in _keys_by_device.pop(id, ()):
+        _cache.pop(key, None)
+
+
+def clear_cache():
+    _cache.clear()
+    _keys_by_device.clear()
+
+
+def _hardware_query(hardware_type: HardwareType, ids: dict[str, Any], *columns):
+    return (
+        select(*columns)
+        .where(Device.hardware_type == hardware_type)
+        .where(*(getattr(Device, name) == value for name, value in ids.items()))
+        .limit(1)
+    )
+
+
+async def resolve_device_ref(hardware_type: HardwareType, **ids) -> Optional[DeviceRef]:
+    """
+    Id, org and location of the device with these hardware ids, cached
+    """
+    key = _cache_key(hardware_type, ids)
+
+    cached = _cache.get(key)
+    if cached is not None:
+        expires, ref = cached
+        if expires > time.monotonic():
+            _cache.move_to_end(key)
+            return ref
+        _drop(key)
+
+    columns = [getattr(Device, name) for name in DeviceRef._fields]
+    row = (
+        await db.session.execute(_hardware_query(hardware_type, ids, *columns))
+    ).first()
+    if row is None:
+        return None
+
+    ref = DeviceRef(*row)
+    _remember(key, ref)
+    return ref
+
+
+async def resolve_device(hardware_type: HardwareType, **ids) -> Optional[Device]:
+    """
+    The live device row with these hardware ids
+    """
+    key = _cache_key(hardware_type, ids)
+
+    result = await db.session.execute(
+        _hardware_query(hardware_type, ids, Device).options(
+            *Device.load_profile("minimal")
+        )
+    )
+    device = result.scalars().first()
+    if device is not None:
+        _remember(
+            key, DeviceRef(*(getattr(device, name) for name in DeviceRef._fields))
+        )
+    return device
+
+
+@event.listens_for(Device, "after_update")
+def _invalidate_changed(mapper, connection, target: Device):
+    # Status flips on every event; only key and routing changes matter.
+    attrs = inspect(target).attrs
+    if any(attrs[name].history.has_changes() for name in WATCHED_COLUMNS):
+        forget_device(target.id)
+
+
+@event.listens_for(Device, "after_delete")
+def _invalidate_deleted(mapper, connection, target: Device):
+    forget_device(target.id)
@@ -4,13 +4,14 @@ from enum import Enum
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
-from pydantic import BaseModel, condecimal, constr, validator
+from pydantic import BaseModel, condecimal, constr, root_validator, validator
 from pydantic.validators import IPv4Address, IPv6Address
-from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy import Column, DateTime, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 from sqlmodel.sql.sqltypes import GUID
 from common_models.util.form import as_form
+from common_models.util.loading import LoadProfilesMixin
 
 from common_models.models.price.model import Price
 from common_models.models.products.condition import ProductCondition
@@ -144,9 +145,48 @@ class DeviceValidatorsMixin:
         raise ValueError("additional_metadata must be a string or a dictionary")
 
 
-class Device(SQLModel, table=True):
+class Device(SQLModel, LoadProfilesMixin, table=True):
     __tablename__ = "device"
-    __table_args__ = {"extend_existing": True}
+    # Hardware callbacks look devices up by these vendor keys, see
+    # common_models.models.device.hardware. mac_address is unique already.
+    __table_args__ = (
+        Index("ix_device_integration_id", "integration_id"),
+        Index("ix_device_locker_udn", "locker_udn"),
+        Index("ix_device_gantner_id", "gantner_id"),
+        Index("ix_device_keynius_id", "keynius_id"),
+        Index("ix_device_harbor", "harbor_tower_id", "harbor_locker_id"),
+        Index("ix_device_dclock", "dclock_terminal_no", "dclock_box_no"),
+        {"extend_existing": True},
+    )
+
+    # Pick one per query with `select(Device).options(*Device.load_profile(...))`.
+    # Relationships a profile leaves out raise on access, so building
+    # Device.Read from the wrong profile fails instead of dropping data.
+    __load_profiles__ = {
+        # Status polls and hardware callbacks: the device row only.
+        "minimal": {
+            "location": "raise",
+            "size": "raise",
+            "price": "raise",
+            "prices": "raise",
+            "product": "raise",
+        },
+        "list": {
+            "location": "joined",
+            "size": "joined",
+            "price": "joined",
+            "prices": "raise",
+            "product": "raise",
+        },
+        # Everything Device.Read serializes, collections in a second query.
+        "detail": {
+            "location": "joined",
+            "size": "joined",
+            "price": "joined",
+            "prices": "selectin",
+            "product": "joined",
+        },
+    }
 
     id: UUID = Field(
         sa_column=Column(
@@ -277,11 +317,13 @@ class Device(SQLModel, table=True):
         },
     )
 
+    # Loaded with one IN query per page of devices instead of a join, which
+    # would repeat every other joined column once per price.
     prices: list["Price"] = Relationship(
         back_populates="devices_list",
         link_model=LinkDevicePrice,
         sa_relationship_kwargs={
-            "lazy": "joined",
+            "lazy": "selectin",
             "uselist": True,
         },
     )
@@ -486,10 +528,16 @@ class Device(SQLModel, table=True):
         transaction_count: Optional[int]
 
     class Read(BaseModel, DeviceValidatorsMixin):
-        def __init__(self, **data):
-            if data.get("locker_udn"):
-                data["ojmar_id"] = data["locker_udn"]
-            super().__init__(**data)
+        # target: source, copied when the source is set. Also applied by
+        # util.fast_read and util.serializer without building the model.
+        __derived_fields__ = {"ojmar_id": "locker_udn"}
+
+        @root_validator(pre=True)
+        def derive_fields(cls, values):
+            for target, source in cls.__derived_fields__.items():
+                if values.get(source):
+                    values = {**values, target: values[source]}
+            return values
 
         id: UUID
         created_at: datetime
@@ -5,11 +5,12 @@ from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
 from common_models.models.device.model import Device
-from fastapi import HTTPException, Request
+from fastapi import Request
 from pydantic import AnyHttpUrl, AnyUrl, BaseModel, condecimal, conint, constr
 from sqlalchemy import Column, DateTime, func
 from sqlmodel import Field, Relationship, SQLModel
 from sqlmodel.sql.sqltypes import GUID
+from common_models.util.loading import LoadProfilesMixin
 
 from common_models.models.memberships.model import Membership
 from common_models.models.promo.model import Promo
@@ -119,10 +120,36 @@ class BatchResponse(BaseModel):
     response: dict | str
 
 
-class Event(SQLModel, table=True):
+class Event(SQLModel, LoadProfilesMixin, table=True):
     __tablename__ = "event"
     __table_args__ = {"extend_existing": True}
 
+    # Pick one per query with `select(Event).options(*Event.load_profile(...))`.
+    __load_profiles__ = {
+        "minimal": {
+            "device": "raise",
+            "user": "raise",
+            "promo": "raise",
+            "membership": "raise",
+        },
+        # Transaction history: everything Event.Read serializes. Devices and
+        # their own relationships come in one IN query per page, so the
+        # event query only joins its user and promo.
+        "feed": {
+            "device": ("selectin", "detail"),
+            "user": "joined",
+            "promo": "joined",
+            "membership": ("selectin", "read"),
+        },
+        # A single event: its device is joined in, saving a round trip.
+        "detail": {
+            "device": ("joined", "detail"),
+            "user": "joined",
+            "promo": "joined",
+            "membership": ("selectin", "read"),
+        },
+    }
+
     id: UUID = Field(
         sa_column=Column(
             "id",
@@ -400,21 +427,16 @@ class DeliveryInput(StartEvent):
         from ..reservations.controller import get_reservation_by_tracking_number
 
         reservation = await get_reservation_by_tracking_number(self.order_id, id_org)
-        if not reservation:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Invalid barcode. Please use another barcode to proceed.",
-            )
-        if not reservation.id_device:
-            raise HTTPException(
-                status_code=400,
-                detail="No device was assigned to this reservation",
-            )
-        if self.id_location and self.id_location != reservation.id_location:
-            raise HTTPException(
-                status_code=400,
-                detail="Reservation must be loaded at the location it was created for",
-            )
+        self.set_reservation(reservation)
+
+    def set_reservation(self, reservation: Reservation | None):
+        """
+        Check and load a fetched or prefetched reservation
+        (see `fetch_reservations_by_tracking_number`)
+        """
+        from ..reservations.tracking import check_delivery_reservation
+
+        check_delivery_reservation(reservation, self.id_location)
 
         self.reservation = reservation
         self.tracking_number = reservation.tracking_number
@@ -0,0 +1,190 @@
+"""
+Per-location device counts by status.
+
+`location_device_count` holds one row per (location, status), kept in step
+with the device table by Device mapper events in the flushing transaction.
+Location lists read their available/reserved/maintenance counts from it
+with `fill_device_counts()` instead of grouping the device table.
+
+Writes that bypass the ORM (bulk COPY, Core UPDATEs) apply their own
+deltas with `counts_upsert()`; `rebuild_counts()` recomputes the table
+from the devices, e.g. to backfill it.
+"""
+
+from collections import Counter
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from fastapi_async_sqlalchemy import db
+from sqlalchemy import Column, ForeignKey, Integer, delete, event, func, inspect, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Field, SQLModel
+from sqlmodel.sql.sqltypes import GUID
+
+from common_models.models.device.model import Device, Status
+
+# Read model field filled from each status' count
+COUNT_FIELDS = {
+    Status.available: "available_devices",
+    Status.reserved: "reserved_devices",
+    Status.maintenance: "maintenance_devices",
+}
+
+# (id_location, Status) -> change in count
+Deltas = Counter
+
+
+class LocationDeviceCount(SQLModel, table=True):
+    __tablename__ = "location_device_count"
+    __table_args__ = {"extend_existing": True}
+
+    id_location: UUID = Field(
+        sa_column=Column(
+            "id_location",
+            GUID(),
+            ForeignKey("location.id", ondelete="CASCADE"),
+            primary_key=True,
+        )
+    )
+    status: Status = Field(primary_key=True)
+    count: int = Field(sa_column=Column("count", Integer, nullable=False, default=0))
+
+
+def _status(value: Any) -> Status:
+    if value is None:
+        return Status.available
+    return Status(getattr(value, "value", value))
+
+
+def _value(device: Any, name: str) -> Any:
+    if isinstance(device, dict):
+        return device.get(name)
+    return getattr(device, name, None)
+
+
+def count_deltas(devices: Iterable[Any], sign: int = 1) -> Deltas:
+    """
+    Deltas for devices (rows or instances) being added, or removed with -1
+    """
+    deltas = Counter()
+    for device in devices:
+        deltas[_value(device, "id_location"), _status(_value(device, "status"))] += sign
+    return deltas
+
+
+def counts_upsert(deltas: Deltas):
+    """
+    Statement adding `deltas` to the counters, or None if nothing changes
+    """
+    rows = [
+        {"id_location": id_location, "status": status, "count": count}
+        for (id_location, status), count in deltas.items()
+        if id_location is not None and count
+    ]
+    if not rows:
+        return None
+
+    table = LocationDeviceCount.__table__
+    statement = insert(table).values(rows)
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.id_location, table.c.status],
+        set_={"count": table.c.count + statement.excluded.count},
+    )
+
+
+def _apply(connection, deltas: Deltas):
+    statement = counts_upsert(deltas)
+    if statement is not None:
+        connection.execute(statement)
+
+
+# Load the old values when these change so after_update can see them, even
+# if they were never read before being assigned.
+@event.listens_for(Device.status, "set", active_history=True)
+@event.listens_for(Device.id_location, "set", active_history=True)
+def _track_history(target, value, oldvalue, initiator):
+    pass
+
+
+@event.listens_for(Device, "after_insert")
+def _count_insert(mapper, connection, target: Device):
+    _apply(connection, Counter({(target.id_location, _status(target.status)): 1}))
+
+
+@event.listens_for(Device, "after_delete")
+def _count_delete(mapper, connection, target: Device):
+    _apply(connection, Counter({(target.id_location, _status(target.status)): -1}))
+
+
+@event.listens_for(Device, "after_update")
+def _count_update(mapper, connection, target: Device):
+    state = inspect(target)
+    location = state.attrs.id_location.history
+    status = state.attrs.status.history
+    if not location.has_changes() and not status.has_changes():
+        return
+
+    old_location = location.deleted[0] if location.deleted else target.id_location
+    old_status = status.deleted[0] if status.deleted else target.status
+
+    deltas = Counter()
+    deltas[old_location, _status(old_status)] -= 1
+    deltas[target.id_location, _status(target.status)] += 1
+    _apply(connection, deltas)
+
+
+async def device_counts(location_ids: Iterable[UUID]) -> dict[UUID, dict[Status, int]]:
+    location_ids = list(location_ids)
+    if not location_ids:
+        return {}
+
+    result = await db.session.execute(
+        select(
+            LocationDeviceCount.id_location,
+            LocationDeviceCount.status,
+            LocationDeviceCount.count,
+        ).where(LocationDeviceCount.id_location.in_(location_ids))
+    )
+
+    counts = {}
+    for id_location, status, count in result.all():
+        counts.setdefault(id_location, {})[status] = count
+    return counts
+
+
+async def fill_device_counts(locations: list) -> list:
+    """
+    Set the device count fields of Location.Read/LocationRead items
+    """
+    counts = await device_counts({location.id for location in locations})
+
+    for location in locations:
+        by_status = counts.get(location.id, {})
+        for status, field in COUNT_FIELDS.items():
+            setattr(location, field, by_status.get(status, 0))
+
+    return locations
+
+
+async def rebuild_counts(id_locations: Optional[Iterable[UUID]] = None):
+    """
+    Recompute the counters from the device table
+    """
+    table = LocationDeviceCount.__table__
+    devices = Device.__table__
+    clear = delete(table)
+    grouped = (
+        select(devices.c.id_location, devices.c.status, func.count())
+        .where(devices.c.id_location.is_not(None))
+        .group_by(devices.c.id_location, devices.c.status)
+    )
+
+    if id_locations is not None:
+        id_locations = list(id_locations)
+        clear = clear.where(table.c.id_location.in_(id_locations))
+        grouped = grouped.where(devices.c.id_location.in_(id_locations))
+
+    await db.session.execute(clear)
+    await db.session.execute(
+        insert(table).from_select(["id_location", "status", "count"], grouped)
+    )
@@ -10,9 +10,12 @@ from sqlmodel import Field, Relationship, SQLModel
 from sqlmodel.sql.sqltypes import GUID
 from common_models.util.form import as_form
 
-if TYPE_CHECKING:
-    from common_models.models.memberships.model import LinkMembershipLocation
-from common_models.models.notifications.model import LinkNotificationLocation
+from common_models.models.memberships.link_membership_location import (
+    LinkMembershipLocation,
+)
+from common_models.models.notifications.link_notification_location import (
+    LinkNotificationLocation,
+)
 from common_models.models.price.model import Price
 
 
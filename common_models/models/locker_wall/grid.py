@@ -0,0 +1,147 @@
+"""
+Grid index over a locker wall's layout.
+
+A wall of `qty_wide` x `qty_tall` cells is flattened into lists indexed by
+`y * qty_wide + x` (0-based), holding each cell's Locker and the id of the
+device it names, so mapping a tapped cell to its device is a list index
+instead of a scan of `lockers` and `devices`.
+
+Grids hold geometry only and are kept in a bounded LRU keyed by wall id.
+Getting a cached grid costs O(1): it is checked against the wall's
+dimensions and cell count, dropped when the wall is updated or deleted
+through the ORM, and expires after `CACHE_TTL` seconds to bound staleness
+from layout edits made elsewhere (other processes, bulk UPDATEs). Call
+`forget_grid()` after changing a layout outside the ORM. Device state
+(status, ...) is never cached: `cell_devices()` pairs the cells with the
+devices loaded in the caller's session.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, conint
+
+CACHE_SIZE = 1024
+CACHE_TTL = 300
+
+_cache: "OrderedDict[UUID, LockerGrid]" = OrderedDict()
+
+
+class Locker(BaseModel):
+    x: conint(ge=0)
+    y: conint(ge=0)
+
+    id: Optional[str] = None
+    kiosk: bool = False
+
+
+def parse_cells(lockers: Iterable[Any]) -> list[Locker]:
+    """
+    Layout cells as Lockers; the JSON column loads them as dicts
+    """
+    return [
+        locker if isinstance(locker, Locker) else Locker.parse_obj(locker)
+        for locker in lockers
+    ]
+
+
+def layout_errors(qty_wide: int, qty_tall: int, lockers: Iterable[Any]) -> list[str]:
+    """
+    Cells outside the wall, cells used twice and devices placed twice
+    """
+    errors, cells, ids = [], set(), set()
+
+    for locker in parse_cells(lockers):
+        if not (0 <= locker.x < qty_wide and 0 <= locker.y < qty_tall):
+            errors.append(
+                f"Locker at ({locker.x}, {locker.y}) is outside the "
+                f"{qty_wide}x{qty_tall} wall"
+            )
+            continue
+        if (locker.x, locker.y) in cells:
+            errors.append(f"More than one locker at ({locker.x}, {locker.y})")
+        cells.add((locker.x, locker.y))
+
+        if locker.id is not None:
+            if locker.id in ids:
+                errors.append(f"Device {locker.id} is placed more than once")
+            ids.add(locker.id)
+
+    return errors
+
+
+class LockerGrid:
+    __slots__ = ("qty_wide", "qty_tall", "lockers", "device_ids", "version", "expires")
+
+    def __init__(self, qty_wide: int, qty_tall: int, lockers: Iterable[Any]):
+        self.qty_wide = qty_wide
+        self.qty_tall = qty_tall
+        self.lockers: list[Optional[Locker]] = [None] * (qty_wide * qty_tall)
+        self.device_ids: list[Optional[str]] = [None] * (qty_wide * qty_tall)
+
+        lockers = parse_cells(lockers)
+        self.version = (qty_wide, qty_tall, len(lockers))
+        self.expires = time.monotonic() + CACHE_TTL
+        for locker in lockers:
+            index = self.index(locker.x, locker.y)
+            if index is None:
+                continue
+            self.lockers[index] = locker
+            if locker.id is not None:
+                self.device_ids[index] = str(locker.id)
+
+    @classmethod
+    def from_wall(cls, wall: Any) -> "LockerGrid":
+        return cls(wall.qty_wide, wall.qty_tall, wall.lockers)
+
+    def current_for(self, wall: Any) -> bool:
+        return (
+            self.version == (wall.qty_wide, wall.qty_tall, len(wall.lockers))
+            and self.expires > time.monotonic()
+        )
+
+    def index(self, x: int, y: int) -> Optional[int]:
+        if 0 <= x < self.qty_wide and 0 <= y < self.qty_tall:
+            return y * self.qty_wide + x
+        return None
+
+    def locker(self, x: int, y: int) -> Optional[Locker]:
+        index = self.index(x, y)
+        return None if index is None else self.lockers[index]
+
+    def device_id(self, x: int, y: int) -> Optional[str]:
+        index = self.index(x, y)
+        return None if index is None else self.device_ids[index]
+
+    def cell_devices(self, devices: Iterable[Any]) -> list[Optional[Any]]:
+        """
+        The given devices (e.g. `wall.devices`) laid out by cell
+        """
+        by_id = {str(device.id): device for device in devices}
+        return [by_id.get(id) if id is not None else None for id in self.device_ids]
+
+    def kiosks(self) -> list[int]:
+        return [
+            index
+            for index, locker in enumerate(self.lockers)
+            if locker is not None and locker.kiosk
+        ]
+
+
+def locker_grid(wall: Any) -> LockerGrid:
+    grid = _cache.get(wall.id)
+    if grid is not None and grid.current_for(wall):
+        _cache.move_to_end(wall.id)
+        return grid
+
+    grid = _cache[wall.id] = LockerGrid.from_wall(wall)
+    _cache.move_to_end(wall.id)
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return grid
+
+
+def forget_grid(id_locker_wall: Optional[UUID]):
+    _cache.pop(id_locker_wall, None)
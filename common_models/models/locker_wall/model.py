@@ -1,18 +1,18 @@
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
-from common_models.models.device.model import Device
-from pydantic import AnyHttpUrl, BaseModel, conint, constr
-from sqlalchemy import JSON, Column
+from common_models.models.device.model import Device, Status
+from pydantic import AnyHttpUrl, BaseModel, conint, constr, root_validator
+from sqlalchemy import JSON, Column, event
 from sqlmodel import Field, Relationship, SQLModel
 
-
-class Locker(BaseModel):
-    x: conint(ge=0)
-    y: conint(ge=0)
-
-    id: Optional[str] = None
-    kiosk: bool = False
+from common_models.models.locker_wall.grid import (
+    Locker,
+    LockerGrid,
+    forget_grid,
+    layout_errors,
+    locker_grid,
+)
 
 
 class LockerWall(SQLModel, table=True):
@@ -51,6 +51,9 @@ class LockerWall(SQLModel, table=True):
         },
     )
 
+    def grid(self) -> LockerGrid:
+        return locker_grid(self)
+
     class Write(BaseModel):
         name: str
         image: Optional[
@@ -85,6 +88,15 @@ class LockerWall(SQLModel, table=True):
             }
         )
 
+        @root_validator(skip_on_failure=True)
+        def validate_layout(cls, values):
+            errors = layout_errors(
+                values["qty_wide"], values["qty_tall"], values["lockers"]
+            )
+            if errors:
+                raise ValueError("; ".join(errors))
+            return values
+
     class Read(BaseModel):
         id: UUID
         created_at: datetime
@@ -122,6 +134,41 @@ class LockerWall(SQLModel, table=True):
         )
         devices: Optional[list[Device.Read]]
 
+    class Compact(BaseModel):
+        """
+        Kiosk payload, one entry per cell in row-major order
+        (index = y * qty_wide + x)
+        """
+
+        id: UUID
+        name: str
+        qty_wide: int
+        qty_tall: int
+
+        devices: list[Optional[UUID]]
+        statuses: list[Optional[Status]]
+        kiosks: list[int]
+
+        @classmethod
+        def from_wall(cls, wall) -> "LockerWall.Compact":
+            grid = locker_grid(wall)
+            devices = grid.cell_devices(wall.devices or ())
+            return cls(
+                id=wall.id,
+                name=wall.name,
+                qty_wide=wall.qty_wide,
+                qty_tall=wall.qty_tall,
+                devices=[device and device.id for device in devices],
+                statuses=[device and device.status for device in devices],
+                kiosks=grid.kiosks(),
+            )
+
+
+@event.listens_for(LockerWall, "after_update")
+@event.listens_for(LockerWall, "after_delete")
+def _forget_wall_grid(mapper, connection, target: LockerWall):
+    forget_grid(target.id)
+
 
 class PaginatedLockerWalls(BaseModel):
     items: list[LockerWall.Read]
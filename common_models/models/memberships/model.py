@@ -7,6 +7,7 @@ from pydantic import BaseModel, condecimal
 from sqlalchemy import Column, DateTime, func
 from sqlmodel import Field, Relationship, SQLModel
 from sqlmodel.sql.sqltypes import GUID
+from common_models.util.loading import LoadProfilesMixin
 
 from common_models.models.location.model import Location
 from common_models.models.organization.model import LinkOrgUser
@@ -34,10 +35,23 @@ class MembershipType(Enum):
     fixed = "fixed"
 
 
-class Membership(SQLModel, table=True):
+class Membership(SQLModel, LoadProfilesMixin, table=True):
     __tablename__ = "memberships"
     __table_args__ = {"extend_existing": True}
 
+    __load_profiles__ = {
+        # The membership row without its member and location lists.
+        "summary": {
+            "locations": "raise",
+            "users": "raise",
+        },
+        # Everything Membership.Read serializes, collections in second queries.
+        "read": {
+            "locations": "selectin",
+            "users": "selectin",
+        },
+    }
+
     id: UUID = Field(
         sa_column=Column(
             "id",
@@ -12,7 +12,9 @@ from common_models.util.form import as_form
 from common_models.models.conditions.link_product_condition import ConditionProductLink
 from common_models.models.product_tracking.product_tracking import ProductTracking
 from common_models.models.products.condition import ProductCondition
-from common_models.models.conditions.model import Condition
+
+if TYPE_CHECKING:
+    from common_models.models.conditions.model import Condition
 
 
 class Product(SQLModel, table=True):
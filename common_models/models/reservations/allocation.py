@@ -0,0 +1,184 @@
+"""
+Batch locker allocation for `Reservation.Batch`.
+
+    results = await allocate_batch(id_org, batch)
+    await db.session.commit()
+
+The location's devices and the reservations on them are loaded once, with
+the devices locked until the transaction ends so concurrent batches at the
+location queue up instead of double booking. Every requested size is then
+allocated in one pass over the compiled availability index: each request
+takes the smallest size (by width, depth and height) that still fits and
+has a free device. Bigger requests go first, so they are not starved by
+smaller ones taking the only large lockers. All reservations are written
+with a single INSERT; each requested size gets an `AllocationResult`, in
+request order.
+
+Transaction control stays with the caller: `allocate_batch` neither
+commits nor rolls back, so the caller commits the reservations together
+with its own pending work (which also releases the device locks), or
+rolls everything back.
+"""
+
+from decimal import Decimal
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException
+from fastapi_async_sqlalchemy import db
+from pydantic import BaseModel
+from sqlalchemy import insert, select
+
+from common_models.models.device.model import Mode
+from common_models.models.reservations.availability import (
+    WEEKDAYS,
+    AvailabilityIndex,
+    TimeZone,
+    load_availability,
+)
+from common_models.models.size.model import Size
+
+
+class AllocationResult(BaseModel):
+    index: int
+    id_size: UUID
+
+    id_device: Optional[UUID]
+    id_size_allocated: Optional[UUID]
+    id_reservation: Optional[UUID]
+
+    error: Optional[str]
+
+
+def _dimensions(size: Any) -> tuple[Decimal, Decimal, Decimal]:
+    return size.width, size.depth, size.height
+
+
+def _fits(size: Any, requested: Any) -> bool:
+    return all(
+        have >= need for have, need in zip(_dimensions(size), _dimensions(requested))
+    )
+
+
+def _volume(size: Any) -> Decimal:
+    width, depth, height = _dimensions(size)
+    return width * depth * height
+
+
+def plan_allocation(
+    index: AvailabilityIndex,
+    sizes: dict[UUID, Any],
+    requested: list[UUID],
+    request: Any,
+) -> list[AllocationResult]:
+    """
+    Assign a free device to each requested size id, without writing
+    """
+    free: dict[UUID, list[UUID]] = {}
+    for id_device in index.free_for(request):
+        free.setdefault(index.sizes[id_device], []).append(id_device)
+    for devices in free.values():
+        devices.reverse()  # pop() hands them out in index order
+
+    by_fit = sorted(sizes.values(), key=lambda size: (_volume(size), _dimensions(size)))
+    order = sorted(
+        range(len(requested)),
+        key=lambda position: (
+            -_volume(sizes[requested[position]]) if requested[position] in sizes else 0
+        ),
+    )
+
+    results: list[Optional[AllocationResult]] = [None] * len(requested)
+    for position in order:
+        id_size = requested[position]
+        result = AllocationResult(index=position, id_size=id_size)
+        results[position] = result
+
+        wanted = sizes.get(id_size)
+        if wanted is None:
+            result.error = "Size not found"
+            continue
+
+        for size in by_fit:
+            if free.get(size.id) and _fits(size, wanted):
+                result.id_device = free[size.id].pop()
+                result.id_size_allocated = size.id
+                break
+        else:
+            result.error = f"No available device fits size {wanted.name}"
+
+    return results
+
+
+def _reservation_row(
+    id_org: UUID, batch: Any, mode: Mode, result: AllocationResult
+) -> dict:
+    row = {
+        "id": uuid4(),
+        "id_org": id_org,
+        "mode": mode,
+        "tracking_number": "",
+        "recurring": batch.recurring,
+        "from_time": batch.from_time,
+        "to_time": batch.to_time,
+        "start_date": batch.start_date,
+        "end_date": batch.end_date,
+        "id_user": batch.id_user,
+        "id_location": batch.id_location,
+        "id_product": batch.id_product,
+        "sender_details": batch.sender_details,
+        "id_device": result.id_device,
+        "id_size": result.id_size_allocated,
+        "started": False,
+    }
+    row.update({day: getattr(batch, day) for day in WEEKDAYS})
+    return row
+
+
+async def _load_sizes(id_org: UUID) -> dict[UUID, Any]:
+    result = await db.session.execute(
+        select(Size.id, Size.name, Size.width, Size.depth, Size.height).where(
+            Size.id_org == id_org
+        )
+    )
+    return {size.id: size for size in result.all()}
+
+
+async def allocate_batch(
+    id_org: UUID,
+    batch: Any,
+    mode: Mode = Mode.delivery,
+    all_or_nothing: bool = False,
+    tz: TimeZone = None,
+) -> list[AllocationResult]:
+    """
+    Allocate and reserve a device for every size in `batch.id_sizes`,
+    reading the batch's times in the location's time zone `tz`.
+    With `all_or_nothing`, nothing is written unless every size got one.
+    The caller commits.
+    """
+    # Imported here so planning can be used without loading every model.
+    from common_models.models.reservations.model import Reservation
+
+    if batch.id_location is None:
+        raise HTTPException(
+            status_code=400, detail="A location is required to allocate devices"
+        )
+
+    sizes = await _load_sizes(id_org)
+    index = await load_availability(batch.id_location, lock=True, tz=tz)
+    results = plan_allocation(index, sizes, list(batch.id_sizes), batch)
+
+    allocated = [result for result in results if result.id_device is not None]
+    if not allocated or (all_or_nothing and len(allocated) < len(results)):
+        for result in allocated:
+            result.id_device = result.id_size_allocated = None
+            result.error = "Not reserved, other sizes could not be allocated"
+        return results
+
+    rows = [_reservation_row(id_org, batch, mode, result) for result in allocated]
+    await db.session.execute(insert(Reservation.__table__).values(rows))
+
+    for result, row in zip(allocated, rows):
+        result.id_reservation = row["id"]
+    return results
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from common_models.models.device.model import Device, Mode
 from pydantic import BaseModel, conint, constr
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, func
 from sqlmodel import Field, Relationship, SQLModel
 from sqlmodel.sql.sqltypes import GUID
 
@@ -17,7 +17,11 @@ from common_models.models.user.model import User
 
 class Reservation(SQLModel, table=True):
     __tablename__ = "reservation"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Delivery loading looks reservations up by scanned barcode.
+        Index("ix_reservation_tracking_number", "id_org", "tracking_number"),
+        {"extend_existing": True},
+    )
 
     id: UUID = Field(
         sa_column=Column(
@@ -114,6 +118,15 @@ class Reservation(SQLModel, table=True):
         )
     )
 
+    def occurrences(self, start: datetime, end: datetime, tz=None):
+        """
+        Lazily yield this reservation's occurrences between start and end,
+        in the org's time zone (`OrgSettings.default_time_zone`)
+        """
+        from common_models.models.reservations.occurrences import occurrences
+
+        return occurrences(self, start, end, tz)
+
     class Write(BaseModel):
         tracking_number: str = ""
         mode: Optional[Mode] = Mode.delivery
@@ -0,0 +1,172 @@
+"""
+Concrete occurrences of reservations in an org's time zone.
+
+    for occurrence in reservation.occurrences(start, end, settings.default_time_zone):
+        ...
+
+    for occurrence in expand_occurrences(reservations, start, end, tz):
+        schedule_reminder(occurrence.reservation, occurrence.start)
+
+A recurring reservation occurs on each flagged weekday from `from_time` to
+`to_time` local time, between the local dates of `start_date` and
+`end_date`. A `to_time` at or before `from_time` ends on the next day.
+Wall-clock times are resolved in the zone on each day: across a DST change
+an occurrence keeps its local times, a start in a spring-forward gap moves
+forward by the gap (and its end with it), and ambiguous fall-back times
+take the first instant.
+A one-off reservation occurs once, from `start_date` to `end_date`.
+
+Both APIs are lazy. `occurrences` resolves one day at a time as it is
+iterated, so a long or open-ended range costs nothing up front.
+`expand_occurrences` computes the occurrence times of each distinct
+(weekdays, from_time, to_time) pattern once, shares them across all
+reservations using that pattern, and yields occurrences from every
+reservation merged in start order.
+"""
+
+import heapq
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+
+from common_models.models.reservations.availability import (
+    MINUTES_PER_DAY,
+    TimeZone,
+    _localize,
+    get_zone,
+    parse_minutes,
+    weekday_mask,
+)
+
+
+class Occurrence(NamedTuple):
+    start: datetime
+    end: Optional[datetime]
+    reservation: Any
+
+
+def _wall(
+    day: date, minute: int, zone: tzinfo, gap: timedelta = timedelta()
+) -> datetime:
+    local = datetime.combine(day, time(), tzinfo=zone) + timedelta(minutes=minute)
+    local += gap
+    # The UTC round trip moves a time that falls in a DST gap past it.
+    return local.astimezone(timezone.utc).astimezone(zone)
+
+
+def _local_days(start: datetime, end: datetime, zone: tzinfo) -> Iterator[date]:
+    # From the day before, whose overnight occurrences can spill into `start`.
+    day = start.astimezone(zone).date() - timedelta(days=1)
+    last = end.astimezone(zone).date()
+    while day <= last:
+        yield day
+        day += timedelta(days=1)
+
+
+def _pattern(reservation: Any) -> tuple[int, int, int]:
+    start = parse_minutes(reservation.from_time) or 0
+    end = parse_minutes(reservation.to_time)
+    return (
+        weekday_mask(reservation),
+        start,
+        MINUTES_PER_DAY if end is None else end,
+    )
+
+
+def _pattern_spans(
+    pattern: tuple[int, int, int], days: Iterable[date], zone: tzinfo
+) -> Iterator[tuple[date, datetime, datetime]]:
+    mask, start, end = pattern
+    overnight = end <= start
+    for day in days:
+        if mask >> day.weekday() & 1:
+            occurrence_start = _wall(day, start, zone)
+            # A start moved past a spring-forward gap moves the end by as
+            # much, so the occurrence keeps its length.
+            wall_start = datetime.combine(day, time()) + timedelta(minutes=start)
+            gap = occurrence_start.replace(tzinfo=None) - wall_start
+            yield (
+                day,
+                occurrence_start,
+                _wall(day + timedelta(days=overnight), end, zone, gap),
+            )
+
+
+def _valid_days(
+    reservation: Any, zone: tzinfo
+) -> tuple[Optional[date], Optional[date]]:
+    start, end = reservation.start_date, reservation.end_date
+    return (
+        start and _localize(start, zone).date(),
+        end and _localize(end, zone).date(),
+    )
+
+
+def _recurring(
+    reservation: Any,
+    spans: Iterable[tuple[date, datetime, datetime]],
+    start: datetime,
+    end: datetime,
+    zone: tzinfo,
+) -> Iterator[Occurrence]:
+    valid_from, valid_until = _valid_days(reservation, zone)
+    for day, occurrence_start, occurrence_end in spans:
+        if valid_from is not None and day < valid_from:
+            continue
+        if valid_until is not None and day > valid_until:
+            break
+        if occurrence_start < end and occurrence_end > start:
+            yield Occurrence(occurrence_start, occurrence_end, reservation)
+
+
+def _one_off(
+    reservation: Any, start: datetime, end: datetime, zone: tzinfo
+) -> Iterator[Occurrence]:
+    if reservation.start_date is None:
+        return
+    occurrence_start = _localize(reservation.start_date, zone)
+    occurrence_end = reservation.end_date and _localize(reservation.end_date, zone)
+    if occurrence_start < end and (occurrence_end is None or occurrence_end > start):
+        yield Occurrence(occurrence_start, occurrence_end, reservation)
+
+
+def occurrences(
+    reservation: Any, start: datetime, end: datetime, tz: TimeZone = None
+) -> Iterator[Occurrence]:
+    """
+    Occurrences of one reservation overlapping [start, end), in start order
+    """
+    zone = get_zone(tz)
+    start, end = _localize(start, zone), _localize(end, zone)
+
+    if not reservation.recurring:
+        return _one_off(reservation, start, end, zone)
+
+    spans = _pattern_spans(_pattern(reservation), _local_days(start, end, zone), zone)
+    return _recurring(reservation, spans, start, end, zone)
+
+
+def expand_occurrences(
+    reservations: Iterable[Any], start: datetime, end: datetime, tz: TimeZone = None
+) -> Iterator[Occurrence]:
+    """
+    Occurrences of many reservations overlapping [start, end), merged in
+    start order
+    """
+    zone = get_zone(tz)
+    start, end = _localize(start, zone), _localize(end, zone)
+    days = list(_local_days(start, end, zone))
+    spans: dict[tuple[int, int, int], list] = {}
+
+    streams = []
+    for reservation in reservations:
+        if not reservation.recurring:
+            streams.append(_one_off(reservation, start, end, zone))
+            continue
+        pattern = _pattern(reservation)
+        if pattern not in spans:
+            spans[pattern] = list(_pattern_spans(pattern, days, zone))
+        streams.append(_recurring(reservation, spans[pattern], start, end, zone))
+
+    # Same-zone comparisons ignore `fold`; timestamps order the repeated
+    # fall-back hour correctly.
+    return heapq.merge(*streams, key=lambda occurrence: occurrence.start.timestamp())
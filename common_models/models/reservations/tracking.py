@@ -0,0 +1,91 @@
+"""
+Tracking-number (barcode) lookup of delivery reservations.
+
+    scans = await fetch_reservations_by_tracking_number(id_org, barcodes, id_location)
+    for scan in scans:
+        if scan.error:
+            ...
+        delivery.set_reservation(scan.reservation)
+
+A whole courier manifest resolves with one query on the
+(id_org, tracking_number) index. Every scan is checked the way
+`DeliveryInput.fetch_reservation` checks a single one, and a failing scan
+carries the HTTPException that single lookup would have raised, so callers
+can report it per parcel or `raise scan.error`.
+"""
+
+from typing import Iterable, NamedTuple, Optional
+from uuid import UUID
+
+from fastapi import HTTPException
+from fastapi_async_sqlalchemy import db
+from sqlalchemy import select
+
+from common_models.models.reservations.model import Reservation
+
+
+class TrackingScan(NamedTuple):
+    tracking_number: str
+    reservation: Optional[Reservation]
+    error: Optional[HTTPException]
+
+
+def check_delivery_reservation(
+    reservation: Optional[Reservation], id_location: Optional[UUID] = None
+) -> Reservation:
+    """
+    Raise unless the reservation can be loaded, at `id_location` if given
+    """
+    if not reservation:
+        raise HTTPException(
+            status_code=404,
+            detail="Invalid barcode. Please use another barcode to proceed.",
+        )
+    if not reservation.id_device:
+        raise HTTPException(
+            status_code=400,
+            detail="No device was assigned to this reservation",
+        )
+    if id_location and id_location != reservation.id_location:
+        raise HTTPException(
+            status_code=400,
+            detail="Reservation must be loaded at the location it was created for",
+        )
+    return reservation
+
+
+async def fetch_reservations_by_tracking_number(
+    id_org: UUID,
+    tracking_numbers: Iterable[str],
+    id_location: Optional[UUID] = None,
+) -> list[TrackingScan]:
+    """
+    Look up and check every scanned tracking number, in scan order
+    """
+    tracking_numbers = list(tracking_numbers)
+    wanted = {number for number in tracking_numbers if number}
+
+    found: dict[str, Reservation] = {}
+    if wanted:
+        result = await db.session.execute(
+            select(Reservation)
+            .where(
+                Reservation.id_org == id_org,
+                Reservation.tracking_number.in_(wanted),
+            )
+            .order_by(Reservation.created_at.desc())
+        )
+        for reservation in result.unique().scalars():
+            # A reused tracking number resolves to its latest reservation.
+            found.setdefault(reservation.tracking_number, reservation)
+
+    scans = []
+    for number in tracking_numbers:
+        reservation = found.get(number)
+        try:
+            check_delivery_reservation(reservation, id_location)
+        except HTTPException as error:
+            scans.append(TrackingScan(number, None, error))
+        else:
+            scans.append(TrackingScan(number, reservation, None))
+    return scans
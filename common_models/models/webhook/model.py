@@ -2,7 +2,6 @@ from enum import Enum
 from typing import Optional, TYPE_CHECKING
 from uuid import UUID
 
-from common_models.models.device.model import Device, Status
 from pydantic import BaseModel
 from sqlalchemy import Column, func
 from sqlmodel import Field, SQLModel
@@ -1,29 +1,272 @@
-from typing import Any
+import base64
+import binascii
+import json
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+from uuid import UUID
 
 from fastapi import HTTPException
 from fastapi_async_sqlalchemy import db
 from pydantic import BaseModel, Field
-from sqlalchemy import VARCHAR, cast
+from sqlalchemy import Boolean, and_, bindparam, func, or_, select, tuple_
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement, UnaryExpression
+from sqlalchemy.sql.selectable import Select
+from sqlmodel.sql.sqltypes import GUID
+
+
+class CountStrategy(Enum):
+    exact = "exact"
+    estimated = "estimated"
+    cached = "cached"
+    none = "none"
+
+
+# Planner estimates are too rough for small sets, count those exactly.
+ESTIMATE_THRESHOLD = 10_000
+COUNT_CACHE_TTL = 60
+COUNT_CACHE_MAX_SIZE = 1024
+
+_count_cache: dict[tuple, tuple[float, int]] = {}
 
 
 class PaginationInfo(BaseModel):
-    total: int = Field(default=0, description="Total number of items.")
+    total: Optional[int] = Field(default=0, description="Total number of items.")
     page: int = Field(default=1, description="Current page number.")
     page_size: int = Field(default=10, description="Number of items per page.")
-    total_pages: int = Field(default=1, description="Total number of pages.")
+    total_pages: Optional[int] = Field(default=1, description="Total number of pages.")
+    has_next: bool = Field(default=False, description="Whether a next page exists.")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Opaque cursor to fetch the next page."
+    )
 
 
-async def _get_by_key_value(key: str, value: str, model: Any) -> Any:
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _coerce_value(column_type: Any, value: Any) -> Any:
+    """
+    Convert a raw (usually string) value to the Python type of a column
+    so it binds with the column's own type instead of a cast.
+    """
+    if value is None:
+        return None
+
+    if isinstance(column_type, GUID):
+        return value if isinstance(value, UUID) else UUID(str(value))
+    if isinstance(column_type, SAEnum) and column_type.enum_class is not None:
+        enum_class = column_type.enum_class
+        return value if isinstance(value, enum_class) else enum_class(value)
+    if isinstance(column_type, Boolean) and isinstance(value, str):
+        if value.lower() in ("true", "1", "yes"):
+            return True
+        if value.lower() in ("false", "0", "no"):
+            return False
+        raise ValueError(f"Invalid boolean: {value}")
+
+    try:
+        python_type = column_type.python_type
+    except NotImplementedError:
+        return value
+
+    if isinstance(value, python_type):
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is Decimal:
+        return Decimal(str(value))
+    if python_type in (int, float, str):
+        return python_type(value)
+    return value
+
+
+def _cursor_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def _encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps([_cursor_value(value) for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, columns: Sequence[Any]) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("Cursor does not match the requested ordering")
+        return [
+            _coerce_value(column.type, value) for column, value in zip(columns, values)
+        ]
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid cursor",
+        )
+
+
+def _split_order_by(order_by: Sequence[Any]) -> tuple[list[Any], list[bool]]:
+    columns, descending = [], []
+
+    for clause in order_by:
+        if isinstance(clause, UnaryExpression) and clause.modifier in (
+            operators.desc_op,
+            operators.asc_op,
+        ):
+            columns.append(clause.element)
+            descending.append(clause.modifier is operators.desc_op)
+        else:
+            columns.append(clause)
+            descending.append(False)
+
+    return columns, descending
+
+
+def _keyset_filter(columns: list[Any], descending: list[bool], values: list[Any]):
+    # A single direction compares row values so Postgres can walk one index.
+    if all(descending) or not any(descending):
+        if len(columns) == 1:
+            column, value = columns[0], values[0]
+            return column < value if descending[0] else column > value
+
+        left, right = tuple_(*columns), tuple_(*values)
+        return left < right if descending[0] else left > right
+
+    clauses = []
+    for i, (column, desc, value) in enumerate(zip(columns, descending, values)):
+        equal = [columns[j] == values[j] for j in range(i)]
+        clauses.append(and_(*equal, column < value if desc else column > value))
+    return or_(*clauses)
+
+
+async def _count_exact(query: Select) -> int:
+    count_query = select(func.count()).select_from(query.subquery())
+    return (await db.session.execute(count_query)).scalar_one()
+
+
+async def _count_estimated(query: Select) -> int:
+    result = await db.session.execute(_Explain(query))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < ESTIMATE_THRESHOLD:
+        return await _count_exact(query)
+    return estimate
+
+
+async def _count_cached(query: Select, ttl: float) -> int:
+    compiled = query.compile()
+    key = (str(compiled), repr(sorted(compiled.params.items())))
+    now = time.monotonic()
+
+    cached = _count_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    total = await _count_exact(query)
+
+    if len(_count_cache) >= COUNT_CACHE_MAX_SIZE:
+        expired = [k for k, (expires, _) in _count_cache.items() if expires <= now]
+        for k in expired:
+            del _count_cache[k]
+        if len(_count_cache) >= COUNT_CACHE_MAX_SIZE:
+            _count_cache.pop(next(iter(_count_cache)))
+
+    _count_cache[key] = (now + ttl, total)
+    return total
+
+
+async def _get_total(
+    query: Select, strategy: CountStrategy, ttl: float
+) -> Optional[int]:
+    query = query.order_by(None)
+
+    if strategy is CountStrategy.exact:
+        return await _count_exact(query)
+    if strategy is CountStrategy.estimated:
+        return await _count_estimated(query)
+    if strategy is CountStrategy.cached:
+        return await _count_cached(query, ttl)
+    return None
+
+
+@lru_cache(maxsize=256)
+def _key_value_select(model: Any, key: str, many: bool = False) -> Select:
+    column = model.__table__.columns[key]
+    if many:
+        return select(model).where(column.in_(bindparam("value", expanding=True)))
+    return select(model).where(column == bindparam("value"))
+
+
+def _coerce_key_value(key: str, value: Any, model: Any) -> Any:
     if key not in model.__table__.columns:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid field: {key}",
         )
 
-    query = query.filter(cast(model.__table__.columns[key], VARCHAR) == value)
+    try:
+        return _coerce_value(model.__table__.columns[key].type, value)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid value for {key}: {value}",
+        )
+
+
+async def _get_by_key_value(key: str, value: str, model: Any) -> Any:
+    value = _coerce_key_value(key, value, model)
+
+    query = _key_value_select(model, key).params(value=value)
+
+    result = await db.session.execute(query)
+    instance = result.unique().scalar_one_or_none()
+    if not instance:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{model.__name__} not found",
+        )
+    return instance
+
+
+async def _get_by_key_values(key: str, values: list[str], model: Any) -> list[Any]:
+    """
+    Fetch every row whose `key` matches one of `values` in a single query
+    """
+    values = list({_coerce_key_value(key, value, model) for value in values})
+    if not values:
+        return []
+
+    query = _key_value_select(model, key, many=True).params(value=values)
 
     result = await db.session.execute(query)
-    model = result.unique().scalar_one()
+    return result.unique().scalars().all()
 
 
 async def _get_paginated_query(
@@ -38,6 +281,72 @@ async def _get_paginated_query(
     paginated_results = results[(page - 1) * size : page * size]
 
     pagination_info = PaginationInfo(
-        total=total, page=page, page_size=size, total_pages=total_pages
+        total=total,
+        page=page,
+        page_size=size,
+        total_pages=total_pages,
+        has_next=page < total_pages,
     )
     return pagination_info, paginated_results
+
+
+async def _get_paginated_select(
+    query: Select,
+    page: int,
+    size: int,
+    order_by: Sequence[Any],
+    cursor: Optional[str] = None,
+    count_strategy: CountStrategy = CountStrategy.exact,
+    count_ttl: float = COUNT_CACHE_TTL,
+) -> tuple[PaginationInfo, list[Any]]:
+    """
+    Paginate a select statement in SQL.
+
+    Without a cursor the page is fetched with LIMIT/OFFSET. With a cursor
+    (taken from a previous page's `next_cursor`) rows are fetched after the
+    last seen `order_by` values, so deep pages cost the same as the first.
+    `order_by` must end with a unique column (e.g. `Model.id`); it may use
+    columns of joined tables or expressions, which are selected alongside
+    the rows so the cursor holds exactly what was sorted on.
+
+    Rows are the selected entity, or tuples of them when `query` selects
+    several.
+
+    `count_strategy` picks how `total` is computed: an exact COUNT, the
+    planner's row estimate (EXPLAIN), an exact count cached for `count_ttl`
+    seconds, or no count at all. `has_next` never depends on the count.
+    """
+    columns, descending = _split_order_by(order_by)
+
+    total = await _get_total(query, count_strategy, count_ttl)
+    total_pages = None if total is None else (total + size - 1) // size
+
+    keys = [column.label(f"cursor_{i}") for i, column in enumerate(columns)]
+    page_query = query.add_columns(*keys).order_by(None).order_by(*order_by)
+    if cursor:
+        values = _decode_cursor(cursor, columns)
+        page_query = page_query.where(_keyset_filter(columns, descending, values))
+    else:
+        page_query = page_query.offset((page - 1) * size)
+
+    result = await db.session.execute(page_query.limit(size + 1))
+    rows = result.unique().all()
+
+    has_next = len(rows) > size
+    next_cursor = None
+    if has_next:
+        rows = rows[:size]
+        next_cursor = _encode_cursor(rows[-1][-len(keys) :])
+
+    width = len(rows[0]) - len(keys) if rows else 1
+    rows = [row[0] if width == 1 else tuple(row[:width]) for row in rows]
+
+    pagination_info = PaginationInfo(
+        total=total,
+        page=page,
+        page_size=size,
+        total_pages=total_pages,
+        has_next=has_next,
+        next_cursor=next_cursor,
+    )
+    return pagination_info, rows
@@ -0,0 +1,107 @@
+"""
+JSON encoding for Read/Paginated responses.
+
+`dumps()` writes the same bytes as FastAPI's
+`JSONResponse(jsonable_encoder(obj))` for every type used by the models
+(UUID, datetime, Decimal, Enum, AnyUrl, nested BaseModels, ...), without
+the jsonable_encoder pass. `ModelJSONResponse` renders with it.
+
+`dumps_orjson()` and `ORJSONModelResponse` encode with orjson when it is
+installed (`pip install common-models[orjson]`). Output is re-rendered with
+`dumps()` where orjson would differ: floats it writes without Python's
+exponent form (`0.00001`, `1e16`) and integers beyond 64 bits. The one
+remaining difference is that NaN and infinity become null instead of
+raising.
+
+    @router.get("/devices", response_class=ModelJSONResponse)
+    async def list_devices(...):
+        return ModelJSONResponse(PaginatedDevices(...))
+"""
+
+import json
+import re
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic.json import decimal_encoder
+
+from common_models.util.serializer import compile_serializer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return compile_serializer(type(obj), by_alias=True)(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return decimal_encoder(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if isinstance(obj, (IPv4Address, IPv6Address, IPv4Network, IPv6Network, PurePath)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    return json.dumps(
+        obj,
+        default=default,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+# Float tokens orjson writes differently from repr(): exponents, and
+# magnitudes below 1e-4 that Python writes as 1e-05 etc. Matches inside
+# strings only cost a fallback.
+_ORJSON_FLOATS = re.compile(rb"(?:^|[:,\[])-?(?:[0-9]+(?:\.[0-9]+)?e-?[0-9]|0\.0000)")
+
+if orjson is not None:
+    # Datetimes go through `default` so they match isoformat() exactly.
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def dumps_orjson(obj: Any) -> bytes:
+        try:
+            content = orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits; dumps() also raises the same
+            # TypeError as the stdlib for unsupported types.
+            return dumps(obj)
+        if _ORJSON_FLOATS.search(content):
+            return dumps(obj)
+        return content
+
+else:
+    dumps_orjson = dumps
+
+
+class ModelJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class ORJSONModelResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps_orjson(content)
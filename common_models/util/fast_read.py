@@ -0,0 +1,120 @@
+"""
+Trusted construction of Read models from rows that came out of our own
+database.
+
+`from_orm_fast(Device.Read, device)` builds the same model as
+`Device.Read.parse_obj(...)` without re-running type validation, regexes,
+URL parsing or decimal checks. Nested Read models are built recursively,
+pre-validators and a Read class's `__derived_fields__` still apply, and the
+few conversions that change a value's type (Decimal to float, raw values
+to Enum/UUID) are applied. Do not use it on client input.
+"""
+
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+ReadModel = TypeVar("ReadModel", bound=BaseModel)
+
+_VALUE = 0
+_MODEL = 1
+_MODEL_LIST = 2
+
+_MISSING = object()
+
+
+def _to_float(value: Any) -> Any:
+    return value if value is None or isinstance(value, float) else float(value)
+
+
+def _coercer(type_: Any) -> Optional[Callable[[Any], Any]]:
+    if type_ is float:
+        return _to_float
+    if isinstance(type_, type) and issubclass(type_, (Enum, UUID)):
+        return lambda value: (
+            value if value is None or isinstance(value, type_) else type_(value)
+        )
+    return None
+
+
+def _is_model(type_: Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _plan(model: type[BaseModel]) -> tuple:
+    fields = []
+
+    for name, field in model.__fields__.items():
+        field: ModelField  # type: ignore
+
+        if _is_model(field.type_) and field.shape == SHAPE_SINGLETON:
+            kind = _MODEL
+        elif _is_model(field.type_) and field.shape == SHAPE_LIST:
+            kind = _MODEL_LIST
+        else:
+            kind = _VALUE
+
+        fields.append(
+            (
+                name,
+                field,
+                kind,
+                _coercer(field.type_) if field.shape == SHAPE_SINGLETON else None,
+                tuple(field.pre_validators or ()),
+            )
+        )
+
+    return tuple(fields), getattr(model, "__derived_fields__", {})
+
+
+def _get(source: Any, name: str) -> Any:
+    if isinstance(source, dict):
+        return source.get(name, _MISSING)
+    return getattr(source, name, _MISSING)
+
+
+def from_orm_fast(model: type[ReadModel], source: Any) -> ReadModel:
+    """
+    Build `model` from an ORM instance or a dict of trusted values
+    """
+    fields, derived = _plan(model)
+    values = {}
+
+    for name, field, kind, coerce, pre_validators in fields:
+        value = _get(source, name)
+        if value is _MISSING:
+            continue
+
+        for validator in pre_validators:
+            value = validator(model, value, values, field, model.__config__)
+
+        if value is None:
+            pass
+        elif kind == _MODEL:
+            value = from_orm_fast(field.type_, value)
+        elif kind == _MODEL_LIST:
+            value = [from_orm_fast(field.type_, item) for item in value]
+        elif coerce:
+            value = coerce(value)
+
+        values[name] = value
+
+    for target, source_name in derived.items():
+        if values.get(source_name):
+            values[target] = values[source_name]
+
+    fields_set = set(values)
+    for name, field, *_ in fields:
+        if name not in fields_set:
+            values[name] = field.get_default()
+
+    return model.construct(_fields_set=fields_set, **values)
+
+
+def from_orm_fast_many(model: type[ReadModel], rows: Iterable[Any]) -> list[ReadModel]:
+    return [from_orm_fast(model, row) for row in rows]
@@ -0,0 +1,165 @@
+"""
+Opt-in statement, row and timing counters for database work.
+
+    install()                                   # once, at startup
+    app.add_middleware(QueryReportMiddleware)   # one report per request
+
+    with track("nightly-export") as report:     # or any block of code
+        ...
+        with timing_reads():
+            items = [Device.Read.parse_obj(d) for d in devices]
+
+Listeners are attached to the Engine class, so they also cover the engine
+that fastapi_async_sqlalchemy creates behind `db.session`. Nothing is
+recorded outside of a `track()` block.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from pydantic import BaseModel, Field
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# The same statement this many times in one report is flagged as a likely N+1.
+REPEATED_STATEMENT_THRESHOLD = 5
+
+
+class QueryReport(BaseModel):
+    name: str
+    statements: int = 0
+    rows: int = 0
+    db_ms: float = 0
+    reads: int = 0
+    read_ms: float = 0
+    repeated: dict[str, int] = Field(default_factory=dict)
+    counts: dict[str, int] = Field(default_factory=dict, exclude=True)
+
+    def record(self, statement: str, rows: int, elapsed: float) -> None:
+        self.statements += 1
+        self.rows += rows
+        self.db_ms += elapsed * 1000
+
+        count = self.counts.get(statement, 0) + 1
+        self.counts[statement] = count
+        if count >= REPEATED_STATEMENT_THRESHOLD:
+            self.repeated[statement] = count
+
+
+_report: ContextVar[Optional[QueryReport]] = ContextVar("query_report", default=None)
+_installed = False
+
+
+# Kept on the statement's execution context, which is discarded with the
+# statement even when it fails and after_cursor_execute never runs.
+_START = "_query_report_start"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    if _report.get() is not None and context is not None:
+        setattr(context, _START, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    report = _report.get()
+    start = getattr(context, _START, None)
+    if report is None or start is None:
+        return
+
+    elapsed = time.perf_counter() - start
+
+    rows = cursor.rowcount
+    if rows < 0:
+        # The asyncpg adapter buffers SELECT results and reports rowcount -1.
+        rows = len(getattr(cursor, "_rows", ()))
+
+    report.record(statement, rows, elapsed)
+
+
+def install() -> None:
+    global _installed
+    if _installed:
+        return
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _installed = True
+
+
+def uninstall() -> None:
+    global _installed
+    if not _installed:
+        return
+
+    event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+    _installed = False
+
+
+def current_report() -> Optional[QueryReport]:
+    return _report.get()
+
+
+def log_report(report: QueryReport) -> None:
+    logger.info(
+        "query_report name=%s statements=%d rows=%d db_ms=%.2f reads=%d read_ms=%.2f",
+        report.name,
+        report.statements,
+        report.rows,
+        report.db_ms,
+        report.reads,
+        report.read_ms,
+    )
+    for statement, count in report.repeated.items():
+        logger.warning(
+            "query_report_n_plus_one name=%s count=%d statement=%r",
+            report.name,
+            count,
+            " ".join(statement.split()),
+        )
+
+
+@contextmanager
+def track(name: str, log: bool = True) -> Iterator[QueryReport]:
+    report = QueryReport(name=name)
+    token = _report.set(report)
+    try:
+        yield report
+    finally:
+        _report.reset(token)
+        if log:
+            log_report(report)
+
+
+@contextmanager
+def timing_reads(count: int = 1) -> Iterator[None]:
+    """
+    Add the time spent in the block to the current report's Read model
+    construction time
+    """
+    report = _report.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if report is not None:
+            report.reads += count
+            report.read_ms += (time.perf_counter() - start) * 1000
+
+
+class QueryReportMiddleware:
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track(f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
@@ -0,0 +1,53 @@
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy.orm import joinedload, noload, raiseload, selectinload
+
+LOADERS = {
+    "joined": joinedload,
+    "selectin": selectinload,
+    "noload": noload,
+    "raise": raiseload,
+}
+
+
+@lru_cache(maxsize=None)
+def load_options(model: Any, profile: str) -> tuple:
+    """
+    Build the loader options for one of a model's `__load_profiles__`.
+
+    A profile maps relationship names to a strategy ("joined", "selectin",
+    "noload", "raise") or to a (strategy, profile) pair that applies a
+    profile of the related model underneath. Relationships not named keep
+    their default strategy.
+    """
+    profiles = getattr(model, "__load_profiles__", {})
+    if profile not in profiles:
+        raise ValueError(f"Unknown load profile for {model.__name__}: {profile}")
+
+    options = []
+    for key, spec in profiles[profile].items():
+        strategy, nested = (spec, None) if isinstance(spec, str) else spec
+        attribute = getattr(model, key)
+
+        option = LOADERS[strategy](attribute)
+        if nested:
+            target = attribute.property.mapper.class_
+            option = option.options(*load_options(target, nested))
+        options.append(option)
+
+    return tuple(options)
+
+
+class LoadProfilesMixin:
+    """
+    `Model.load_profile(name)` for models declaring `__load_profiles__`
+    """
+
+    __load_profiles__: dict = {}
+    # SQLModel's metaclass reads `__config__` from every base class.
+    __config__ = None
+
+    @classmethod
+    def load_profile(cls, name: str) -> tuple:
+        return load_options(cls, name)
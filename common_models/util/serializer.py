@@ -0,0 +1,133 @@
+"""
+Precompiled serializers for Read models.
+
+`compile_serializer(Device.Read)` returns a function that turns an ORM
+instance (or a dict of trusted values) straight into the JSON-ready dict
+`Device.Read(...).json()` would produce, without building the model.
+The field walk, nested serializers, per-type encoders and the class's
+`__derived_fields__` are resolved once per class.
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.json import decimal_encoder, pydantic_encoder
+
+Serializer = Callable[[Any], dict]
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, BaseModel):
+        return _jsonable(value.dict())
+    return _jsonable(pydantic_encoder(value))
+
+
+def _decimal(value: Any) -> Any:
+    return decimal_encoder(value if isinstance(value, Decimal) else Decimal(value))
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, (date, time)) else value
+
+
+def _encoder(type_: Any, by_alias: bool) -> Callable[[Any], Any]:
+    if not isinstance(type_, type):
+        return _jsonable
+    if issubclass(type_, BaseModel):
+        return compile_serializer(type_, by_alias)
+    if issubclass(type_, Enum):
+        return _enum_value
+    if issubclass(type_, bool):
+        return bool
+    if issubclass(type_, Decimal):
+        return _decimal
+    if issubclass(type_, float):
+        return float
+    if issubclass(type_, int):
+        return int
+    if issubclass(type_, str):
+        return str
+    if issubclass(type_, UUID):
+        return str
+    if issubclass(type_, (datetime, date, time)):
+        return _isoformat
+    return _jsonable
+
+
+def _field_encoder(field: ModelField, by_alias: bool) -> Callable[[Any], Any]:
+    encode = _encoder(field.type_, by_alias)
+
+    if field.shape == SHAPE_SINGLETON:
+        return encode
+    if field.shape == SHAPE_LIST:
+        return lambda values: [
+            None if value is None else encode(value) for value in values
+        ]
+    return _jsonable
+
+
+def _getter(name: str, default: Any) -> Callable[[Any], Any]:
+    def get(source: Any) -> Any:
+        if isinstance(source, dict):
+            return source.get(name, default)
+        return getattr(source, name, default)
+
+    return get
+
+
+def _derived_getter(
+    get: Callable[[Any], Any], get_from: Callable[[Any], Any]
+) -> Callable[[Any], Any]:
+    def derived(source: Any) -> Any:
+        return get_from(source) or get(source)
+
+    return derived
+
+
+@lru_cache(maxsize=None)
+def compile_serializer(model: type[BaseModel], by_alias: bool = False) -> Serializer:
+    derived = getattr(model, "__derived_fields__", {})
+    plan = []
+
+    for name, field in model.__fields__.items():
+        get = _getter(name, field.get_default())
+        if name in derived:
+            get = _derived_getter(get, _getter(derived[name], None))
+        key = field.alias if by_alias else name
+        plan.append((key, get, _field_encoder(field, by_alias)))
+
+    def serialize(source: Any) -> dict:
+        data = {}
+        for key, get, encode in plan:
+            value = get(source)
+            data[key] = None if value is None else encode(value)
+        return data
+
+    serialize.__qualname__ = f"serialize_{model.__qualname__.replace('.', '_')}"
+    return serialize
+
+
+def serialize_json(model: type[BaseModel], source: Any) -> str:
+    return json.dumps(compile_serializer(model)(source))
+
+
+def serialize_many(model: type[BaseModel], sources: Optional[list]) -> list[dict]:
+    serialize = compile_serializer(model)
+    return [serialize(source) for source in sources or ()]
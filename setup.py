@@ -11,6 +11,7 @@ setup(
         "sqlalchemy==1.4.41",
         "sqlmodel==0.0.8",
     ],
+    extras_require={"orjson": ["orjson>=3.8"]},
     description="Shared models for locker-api and bulk-upload-service",
     author="Koloni",
     author_email="info@koloni.me",
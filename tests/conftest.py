@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "benchmarks")]
+
+from payloads import Payloads  # noqa: E402
+
+
+def _as_row(value):
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _as_row(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_as_row(item) for item in value]
+    return value
+
+
+@pytest.fixture
+def payloads() -> Payloads:
+    return Payloads(0)
+
+
+@pytest.fixture
+def as_row():
+    """
+    Turn a payload into attribute objects shaped like ORM instances
+    """
+    return _as_row
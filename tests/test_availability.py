@@ -0,0 +1,293 @@
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+from common_models.models.reservations import availability
+from common_models.models.reservations.availability import (
+    ALL_DAYS,
+    MINUTES_PER_DAY,
+    WEEKDAYS,
+    AvailabilityIndex,
+    _rotate,
+    compile_reservation,
+    load_availability,
+)
+
+DEVICE = uuid4()
+
+
+def reservation(recurring=False, days=(), start=None, end=None, **fields):
+    fields.setdefault("from_time", None)
+    fields.setdefault("to_time", None)
+    return SimpleNamespace(
+        id_device=DEVICE,
+        recurring=recurring,
+        start_date=start,
+        end_date=end,
+        **{day: day in days for day in WEEKDAYS},
+        **fields,
+    )
+
+
+def index(*reservations, tz=None) -> AvailabilityIndex:
+    return AvailabilityIndex(
+        [SimpleNamespace(id=DEVICE, id_size=None)], reservations, tz
+    )
+
+
+def test_open_start_request_is_not_walked_day_by_day():
+    booked = index(
+        reservation(start=datetime(2026, 5, 4, 9), end=datetime(2026, 5, 4, 10))
+    )
+
+    started = time.perf_counter()
+    assert booked.conflicts(DEVICE, reservation(end=datetime(2026, 5, 4, 9, 30)))
+    assert not booked.conflicts(DEVICE, reservation(end=datetime(2026, 5, 4, 9)))
+    assert time.perf_counter() - started < 0.1
+
+
+def test_open_start_request_against_windows():
+    weekly = index(
+        reservation(
+            recurring=True,
+            days=("monday",),
+            from_time="09:00",
+            to_time="10:00",
+            start=datetime(2026, 6, 1),
+        )
+    )
+    assert weekly.conflicts(DEVICE, reservation(end=datetime(2026, 6, 2)))
+    assert not weekly.conflicts(DEVICE, reservation(end=datetime(2026, 5, 30)))
+
+
+def weekly_batch(**fields):
+    fields.setdefault("days", ("monday",))
+    fields.setdefault("from_time", "09:00")
+    fields.setdefault("to_time", "10:00")
+    return reservation(recurring=True, start=datetime(2026, 5, 1), **fields)
+
+
+def test_one_off_blocks_recurring_batch_only_where_it_overlaps():
+    # Monday 2026-05-04, 09:30-11:00
+    booked = index(
+        reservation(start=datetime(2026, 5, 4, 9, 30), end=datetime(2026, 5, 4, 11))
+    )
+
+    assert booked.conflicts(DEVICE, weekly_batch())
+    assert not booked.conflicts(DEVICE, weekly_batch(days=("tuesday",)))
+    assert not booked.conflicts(
+        DEVICE, weekly_batch(from_time="11:00", to_time="12:00")
+    )
+    assert booked.free_for(weekly_batch(from_time="07:00", to_time="09:30")) == [DEVICE]
+
+
+def test_one_off_spanning_days_against_overnight_batch():
+    # Saturday 2026-05-09 22:00 to Sunday 01:00
+    booked = index(
+        reservation(start=datetime(2026, 5, 9, 22), end=datetime(2026, 5, 10, 1))
+    )
+
+    # Friday 23:00 to Saturday 01:00 never reaches Saturday night.
+    assert not booked.conflicts(
+        DEVICE, weekly_batch(days=("friday",), from_time="23:00", to_time="01:00")
+    )
+    # Saturday 23:30 to Sunday 00:30 does.
+    assert booked.conflicts(
+        DEVICE, weekly_batch(days=("saturday",), from_time="23:30", to_time="00:30")
+    )
+    # Sunday's window starts after the booking ends.
+    assert not booked.conflicts(
+        DEVICE, weekly_batch(days=("sunday",), from_time="01:00", to_time="02:00")
+    )
+
+
+def test_one_off_outside_batch_dates():
+    booked = index(
+        reservation(start=datetime(2026, 4, 27, 9), end=datetime(2026, 4, 27, 10))
+    )
+    assert not booked.conflicts(DEVICE, weekly_batch())
+
+
+def test_open_ended_one_off_blocks_later_windows():
+    booked = index(reservation(start=datetime(2026, 5, 4, 12)))
+    assert booked.conflicts(DEVICE, weekly_batch(days=("wednesday",)))
+
+
+def test_rotate_moves_days_forward():
+    assert _rotate(0b0000001) == 0b0000010  # Monday -> Tuesday
+    assert _rotate(0b1000000) == 0b0000001  # Sunday -> Monday
+    assert _rotate(ALL_DAYS) == ALL_DAYS
+
+
+def test_overnight_window_is_split_at_midnight():
+    friday = reservation(
+        recurring=True,
+        days=("friday", "sunday"),
+        from_time="22:00",
+        to_time="02:00",
+        start=datetime(2026, 5, 1),
+        end=datetime(2026, 5, 31),
+    )
+    before, after = compile_reservation(friday)
+
+    assert (before.start, before.end, before.shift) == (22 * 60, MINUTES_PER_DAY, 0)
+    assert (after.start, after.end, after.shift) == (0, 2 * 60, 1)
+    assert after.days == _rotate(before.days)  # Saturday and Monday
+
+    assert before.day_range() == (date(2026, 5, 1), date(2026, 5, 31))
+    assert after.day_range() == (date(2026, 5, 2), date(2026, 6, 1))
+    # June 1st's early hours belong to May 31st's occurrence.
+    assert after.valid_on(date(2026, 6, 1))
+    assert not after.valid_on(date(2026, 5, 1))
+    assert not before.valid_on(date(2026, 6, 1))
+
+
+def test_overnight_window_blocks_next_morning():
+    booked = index(
+        reservation(
+            recurring=True, days=("friday",), from_time="22:00", to_time="02:00"
+        )
+    )
+    saturday = datetime(2026, 5, 9)
+    assert not booked.is_free(
+        DEVICE, saturday + timedelta(hours=1), saturday + timedelta(hours=3)
+    )
+    assert booked.is_free(
+        DEVICE, saturday + timedelta(hours=2), saturday + timedelta(hours=3)
+    )
+    assert booked.is_free(
+        DEVICE, saturday + timedelta(hours=22), saturday + timedelta(hours=23)
+    )
+
+
+def test_recurring_midnight_to_time():
+    booked = index(
+        reservation(
+            recurring=True, days=("monday",), from_time="20:00", to_time="00:00"
+        )
+    )
+    monday = datetime(2026, 5, 4)
+    assert not booked.is_free(
+        DEVICE, monday + timedelta(hours=23), monday + timedelta(hours=24)
+    )
+    assert booked.is_free(
+        DEVICE, monday + timedelta(hours=24), monday + timedelta(hours=25)
+    )
+
+
+def test_windows_read_in_the_index_zone():
+    booked = index(
+        reservation(
+            recurring=True, days=("monday",), from_time="09:00", to_time="10:00"
+        ),
+        tz="America/New_York",
+    )
+    # 09:30 in New York, given naive (local) and aware (UTC).
+    assert not booked.is_free(
+        DEVICE, datetime(2026, 1, 5, 9, 30), datetime(2026, 1, 5, 9, 40)
+    )
+    assert not booked.is_free(
+        DEVICE,
+        datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc),
+        datetime(2026, 1, 5, 14, 40, tzinfo=timezone.utc),
+    )
+    # 09:30 UTC is 04:30 in New York.
+    assert booked.is_free(
+        DEVICE,
+        datetime(2026, 1, 5, 9, 30, tzinfo=timezone.utc),
+        datetime(2026, 1, 5, 9, 40, tzinfo=timezone.utc),
+    )
+
+
+def test_one_off_naive_is_local_and_aware_is_an_instant():
+    naive = index(
+        reservation(start=datetime(2026, 1, 5, 12), end=datetime(2026, 1, 5, 13)),
+        tz="America/New_York",
+    )
+    aware = index(
+        reservation(
+            start=datetime(2026, 1, 5, 12, tzinfo=timezone.utc),
+            end=datetime(2026, 1, 5, 13, tzinfo=timezone.utc),
+        ),
+        tz="America/New_York",
+    )
+    noon_utc = datetime(2026, 1, 5, 12, 15, tzinfo=timezone.utc)
+    noon_local = datetime(2026, 1, 5, 12, 15)
+
+    assert naive.is_free(DEVICE, noon_utc, noon_utc + timedelta(minutes=10))
+    assert not naive.is_free(DEVICE, noon_local, noon_local + timedelta(minutes=10))
+    assert not aware.is_free(DEVICE, noon_utc, noon_utc + timedelta(minutes=10))
+    assert aware.is_free(DEVICE, noon_local, noon_local + timedelta(minutes=10))
+
+
+def test_recurring_dates_use_the_local_day():
+    # 2026-05-12 02:00 UTC is still May 11th in New York.
+    booked = index(
+        reservation(
+            recurring=True,
+            days=WEEKDAYS,
+            from_time="09:00",
+            to_time="10:00",
+            end=datetime(2026, 5, 12, 2, tzinfo=timezone.utc),
+        ),
+        tz="America/New_York",
+    )
+    assert not booked.is_free(
+        DEVICE, datetime(2026, 5, 11, 9), datetime(2026, 5, 11, 10)
+    )
+    assert booked.is_free(DEVICE, datetime(2026, 5, 12, 9), datetime(2026, 5, 12, 10))
+
+
+def test_free_devices_by_size():
+    small, large = uuid4(), uuid4()
+    devices = [
+        SimpleNamespace(id=DEVICE, id_size=small),
+        SimpleNamespace(id=uuid4(), id_size=small),
+        SimpleNamespace(id=uuid4(), id_size=large),
+    ]
+    booked = AvailabilityIndex(
+        devices, [reservation(start=datetime(2026, 5, 4), end=datetime(2026, 5, 5))]
+    )
+    start, end = datetime(2026, 5, 4, 9), datetime(2026, 5, 4, 10)
+
+    assert booked.free_devices(start, end, small) == [devices[1].id]
+    assert booked.free_devices(start, end) == [devices[1].id, devices[2].id]
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+def test_load_availability_keeps_current_reservations(monkeypatch):
+    from common_models import bootstrap
+
+    bootstrap()
+    statements = []
+
+    async def execute(statement):
+        statements.append(statement)
+        return _Result(
+            [SimpleNamespace(id=DEVICE, id_size=None)] if len(statements) == 1 else []
+        )
+
+    monkeypatch.setattr(
+        availability, "db", SimpleNamespace(session=SimpleNamespace(execute=execute))
+    )
+    since = datetime(2026, 5, 4, 12, tzinfo=timezone.utc)
+    loaded = asyncio.run(load_availability(uuid4(), tz="Europe/Paris", since=since))
+
+    assert loaded.zone == ZoneInfo("Europe/Paris")
+    where = statements[1].whereclause.compile()
+    assert "reservation.end_date IS NULL" in str(where)
+    assert "reservation.recurring IS true" in str(where)
+    cutoffs = sorted(
+        value for value in where.params.values() if isinstance(value, datetime)
+    )
+    assert cutoffs == [since - timedelta(days=2), since]
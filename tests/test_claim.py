@@ -0,0 +1,67 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from common_models import bootstrap
+from common_models.models.device import claim
+from common_models.models.device.claim import claim_device, claim_query
+from common_models.models.device.model import Device, Status
+
+
+@pytest.fixture(scope="module", autouse=True)
+def configured():
+    bootstrap()
+
+
+def sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_minimal_claim_locks_only_the_device_row():
+    statement = sql(claim_query(uuid4()))
+    assert " JOIN " not in statement
+    assert statement.endswith("FOR UPDATE OF device SKIP LOCKED")
+
+
+def test_claim_with_loader_options_still_locks_only_the_device():
+    statement = sql(claim_query(uuid4(), options=Device.load_profile("list")))
+    assert " JOIN " in statement
+    assert statement.endswith("FOR UPDATE OF device SKIP LOCKED")
+
+
+def fake_session(monkeypatch, device):
+    executed = []
+
+    async def execute(statement):
+        executed.append(statement)
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(first=lambda: device))
+
+    async def flush():
+        pass
+
+    monkeypatch.setattr(
+        claim,
+        "db",
+        SimpleNamespace(session=SimpleNamespace(execute=execute, flush=flush)),
+    )
+    return executed
+
+
+def test_claim_sets_status_with_caller_options(monkeypatch):
+    device = SimpleNamespace(status=Status.available)
+    executed = fake_session(monkeypatch, device)
+
+    claimed = asyncio.run(claim_device(uuid4(), options=Device.load_profile("detail")))
+    assert claimed is device and device.status == Status.reserved
+    assert "FOR UPDATE OF device SKIP LOCKED" in sql(executed[0])
+
+
+def test_no_device_available(monkeypatch):
+    fake_session(monkeypatch, None)
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(claim_device(uuid4()))
+    assert error.value.status_code == 404
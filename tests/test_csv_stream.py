@@ -0,0 +1,35 @@
+import io
+
+from common_models.bulk.csv_stream import read_chunks, read_rows, validate_chunk
+from common_models.models.device.model import Device, HardwareType, Mode, Status
+
+
+def test_blank_cells_take_model_defaults():
+    lines = io.StringIO("Name,Mode,Status,Hardware Type,Location\nL1,,,,Loc\n")
+    valid, errors = validate_chunk(Device.WriteCSV, list(read_rows(lines)))
+
+    assert errors == []
+    [(line, device)] = valid
+    assert line == 2
+    assert device.mode == Mode.service
+    assert device.status == Status.available
+    assert device.hardware_type == HardwareType.linka
+    assert device.location == "Loc"
+    assert device.price_required is False
+
+
+def test_rows_are_stripped_and_blank_lines_skipped():
+    lines = io.StringIO("Name , Locker Number\n L1 , 4 \n,\n\nL2,\n")
+    assert list(read_rows(lines)) == [
+        (2, {"name": "L1", "locker_number": "4"}),
+        (5, {"name": "L2"}),
+    ]
+
+
+def test_invalid_cells_report_row_and_field():
+    lines = io.StringIO("Name,Mode\nL1,service\nL2,bogus\n")
+    [chunk] = read_chunks(lines)
+    valid, errors = validate_chunk(Device.WriteCSV, chunk)
+
+    assert [line for line, _ in valid] == [2]
+    assert [(error.row, error.field) for error in errors] == [(3, "mode")]
@@ -0,0 +1,96 @@
+import math
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from common_models.models.device.model import PaginatedDevices
+from common_models.models.event.model import PaginatedEvents
+from common_models.models.location.model import Location
+from common_models.util.encoder import (
+    ModelJSONResponse,
+    ORJSONModelResponse,
+    dumps,
+    dumps_orjson,
+)
+
+ENCODERS = [dumps, dumps_orjson]
+
+
+def reference(obj) -> bytes:
+    return JSONResponse(jsonable_encoder(obj)).body
+
+
+def paginated_devices(payloads, count: int = 25) -> PaginatedDevices:
+    return PaginatedDevices.parse_obj(
+        {
+            "items": [payloads.device() for _ in range(count)],
+            "total": count,
+            "pages": 1,
+        }
+    )
+
+
+def paginated_events(payloads, count: int = 10) -> PaginatedEvents:
+    return PaginatedEvents.parse_obj(
+        {
+            "items": [payloads.event() for _ in range(count)],
+            "total": count,
+            "pages": 1,
+        }
+    )
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+def test_paginated_devices(payloads, encode):
+    page = paginated_devices(payloads)
+    assert encode(page) == reference(page)
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+def test_paginated_events(payloads, encode):
+    page = paginated_events(payloads)
+    assert encode(page) == reference(page)
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+def test_location_with_devices(payloads, encode):
+    location = Location.Read.parse_obj(
+        payloads.location(devices=[payloads.device(nested=False) for _ in range(5)])
+    )
+    assert encode(location) == reference(location)
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+@pytest.mark.parametrize(
+    "value",
+    [1e-05, 0.0001, -2.5e-07, 1e16, 1.2e17, 1e15, 0.1, 2**70, "x:1e5", [0.00001]],
+)
+def test_edge_values(encode, value):
+    obj = {"value": value, "items": [value]}
+    assert encode(obj) == reference(obj)
+
+
+@pytest.mark.parametrize("encode", ENCODERS)
+def test_float_field(payloads, encode):
+    page = paginated_devices(payloads, 1)
+    page.items[0].size.width = 1e-05
+    assert encode(page) == reference(page)
+
+
+def test_nan_raises_like_jsonresponse():
+    with pytest.raises(ValueError):
+        reference({"value": math.nan})
+    with pytest.raises(ValueError):
+        dumps({"value": math.nan})
+
+
+def test_unsupported_type_raises():
+    with pytest.raises(TypeError):
+        dumps_orjson({"value": object()})
+
+
+@pytest.mark.parametrize("response", [ModelJSONResponse, ORJSONModelResponse])
+def test_responses(payloads, response):
+    page = paginated_devices(payloads, 5)
+    assert response(page).body == reference(page)
@@ -0,0 +1,85 @@
+from decimal import Decimal
+
+import pytest
+
+from common_models.models.device.model import Device, Status
+from common_models.models.event.model import Event
+from common_models.models.location.model import Location
+from common_models.models.price.model import Price
+from common_models.models.size.model import Size
+from common_models.util.fast_read import from_orm_fast, from_orm_fast_many
+
+CASES = {
+    "device": (Device.Read, lambda p: p.device()),
+    "device-flat": (Device.Read, lambda p: p.device(nested=False)),
+    "event": (Event.Read, lambda p: p.event()),
+    "location": (
+        Location.Read,
+        lambda p: p.location(devices=[p.device(nested=False) for _ in range(5)]),
+    ),
+    "size": (Size.Read, lambda p: p.size()),
+    "price": (Price.Read, lambda p: p.price()),
+}
+
+
+def assert_same(fast, validated):
+    assert type(fast) is type(validated)
+    assert fast.dict() == validated.dict()
+    assert fast.json() == validated.json()
+    assert fast.__fields_set__ == validated.__fields_set__
+
+
+@pytest.mark.parametrize("case", CASES)
+@pytest.mark.parametrize("source", ["dict", "attributes"])
+def test_matches_parse_obj(payloads, as_row, case, source):
+    model, make = CASES[case]
+    for _ in range(20):
+        payload = make(payloads)
+        row = payload if source == "dict" else as_row(payload)
+        assert_same(from_orm_fast(model, row), model.parse_obj(payload))
+
+
+@pytest.mark.parametrize("source", ["dict", "attributes"])
+def test_derived_ojmar_id(payloads, as_row, source):
+    payload = payloads.device()
+    payload.update(hardware_type="ojmar", locker_udn="123456789012")
+    row = payload if source == "dict" else as_row(payload)
+
+    fast = from_orm_fast(Device.Read, row)
+    assert fast.ojmar_id == "123456789012"
+    assert "ojmar_id" in fast.__fields_set__
+    assert_same(fast, Device.Read.parse_obj(payload))
+
+
+def test_nested_models_and_lists(payloads, as_row):
+    payload = payloads.device()
+    payload["prices"] = [payloads.price() for _ in range(3)]
+    fast = from_orm_fast(Device.Read, as_row(payload))
+
+    assert isinstance(fast.size, Size.Read)
+    assert isinstance(fast.price, Price.Read)
+    assert isinstance(fast.location, Device.Read.__fields__["location"].type_)
+    assert [type(price) for price in fast.prices] == [Price.Read] * 3
+    assert isinstance(fast.size.width, float)
+    assert fast.status in Status
+    assert_same(fast, Device.Read.parse_obj(payload))
+
+
+def test_missing_fields_are_unset(payloads):
+    payload = payloads.size()
+    del payload["description"], payload["image"]
+    assert_same(from_orm_fast(Size.Read, payload), Size.Read.parse_obj(payload))
+
+
+def test_none_values(payloads):
+    payload = payloads.device()
+    payload.update(location=None, size=None, price=None, product=None, prices=[])
+    assert_same(from_orm_fast(Device.Read, payload), Device.Read.parse_obj(payload))
+
+
+def test_many(payloads):
+    rows = [payloads.price() for _ in range(5)]
+    rows[0]["amount"] = Decimal("0.10")
+    assert [price.dict() for price in from_orm_fast_many(Price.Read, rows)] == [
+        Price.Read.parse_obj(row).dict() for row in rows
+    ]
@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from common_models.util.instrumentation import (
+    REPEATED_STATEMENT_THRESHOLD,
+    install,
+    track,
+    uninstall,
+)
+
+
+@pytest.fixture
+def engine():
+    install()
+    engine = create_engine("sqlite://")
+    yield engine
+    uninstall()
+    engine.dispose()
+
+
+def test_counts_statements_and_rows(engine):
+    with engine.connect() as conn, track("test", log=False) as report:
+        conn.execute(text("CREATE TABLE item (id INTEGER)"))
+        conn.execute(text("INSERT INTO item VALUES (1), (2), (3)"))
+        for _ in range(REPEATED_STATEMENT_THRESHOLD):
+            conn.execute(text("SELECT id FROM item")).all()
+
+    assert report.statements == 2 + REPEATED_STATEMENT_THRESHOLD
+    assert report.rows >= 3
+    assert report.db_ms > 0
+    assert report.repeated == {"SELECT id FROM item": REPEATED_STATEMENT_THRESHOLD}
+
+
+def test_failed_statements_leave_nothing_on_the_connection(engine):
+    with engine.connect() as conn, track("test", log=False) as report:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing"))
+        conn.execute(text("SELECT 1"))
+
+        # The pooled connection's info outlives the request.
+        assert conn.info == {}
+
+    assert report.statements == 1
+
+
+def test_untracked_statements_are_not_recorded(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    with track("empty", log=False) as report:
+        pass
+    assert report.statements == 0
@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from common_models import bootstrap
+from common_models.models.device.model import Device
+from common_models.models.event.model import Event
+from common_models.models.memberships.model import Membership
+
+
+@pytest.fixture(scope="module", autouse=True)
+def configured():
+    bootstrap()
+
+
+def joins(model, profile: str) -> int:
+    statement = select(model).options(*model.load_profile(profile))
+    return str(statement.compile(dialect=postgresql.dialect())).count(" JOIN ")
+
+
+def test_event_feed_joins_only_to_one_rows():
+    assert joins(Event, "feed") == 2  # user, promo
+    assert joins(Event, "detail") > joins(Event, "feed")
+
+
+@pytest.mark.parametrize("model", [Device, Event, Membership])
+def test_every_profile_builds(model):
+    for profile in model.__load_profiles__:
+        assert model.load_profile(profile)
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        Device.load_profile("everything")
@@ -0,0 +1,102 @@
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from common_models.models.device.model import Status
+from common_models.models.locker_wall import grid as grid_module
+from common_models.models.locker_wall.grid import (
+    forget_grid,
+    layout_errors,
+    locker_grid,
+)
+from common_models.models.locker_wall.model import LockerWall
+
+
+def device(status=Status.available):
+    return SimpleNamespace(id=uuid4(), status=status)
+
+
+@pytest.fixture
+def wall():
+    # Shaped like a row loaded from the database: `lockers` holds dicts.
+    devices = [device(), device(Status.maintenance)]
+    wall = SimpleNamespace(
+        id=uuid4(),
+        name="Wall",
+        qty_wide=3,
+        qty_tall=2,
+        devices=devices,
+        lockers=[
+            {"x": 0, "y": 0, "id": str(devices[0].id), "kiosk": False},
+            {"x": 2, "y": 1, "id": str(devices[1].id)},
+            {"x": 1, "y": 0, "id": None, "kiosk": True},
+        ],
+    )
+    yield wall
+    forget_grid(wall.id)
+
+
+def test_dict_cells(wall):
+    grid = locker_grid(wall)
+    assert grid.device_id(0, 0) == str(wall.devices[0].id)
+    assert grid.device_id(2, 1) == str(wall.devices[1].id)
+    assert grid.device_id(1, 1) is None
+    assert grid.locker(1, 0).kiosk
+    assert grid.kiosks() == [1]
+
+
+def test_compact_reads_current_statuses(wall):
+    compact = LockerWall.Compact.from_wall(wall)
+    assert compact.devices == [
+        wall.devices[0].id,
+        None,
+        None,
+        None,
+        None,
+        wall.devices[1].id,
+    ]
+    assert compact.statuses[0] == Status.available
+
+    # A later session loads the same wall with a different status.
+    wall.devices = [device(), device()]
+    wall.devices[0].id = compact.devices[0]
+    wall.devices[0].status = Status.reserved
+    compact = LockerWall.Compact.from_wall(wall)
+    assert compact.statuses[0] == Status.reserved
+    assert compact.devices[5] is None
+
+
+def test_resized_layout_rebuilds(wall):
+    grid = locker_grid(wall)
+    assert locker_grid(wall) is grid
+
+    wall.lockers = [{"x": 1, "y": 1, "id": "moved"}]
+    rebuilt = locker_grid(wall)
+    assert rebuilt is not grid
+    assert rebuilt.device_id(1, 1) == "moved"
+    assert rebuilt.device_id(0, 0) is None
+
+
+def test_same_size_edit_needs_forget_or_expiry(wall, monkeypatch):
+    grid = locker_grid(wall)
+    wall.lockers = [dict(cell, id=None) for cell in wall.lockers]
+    assert locker_grid(wall) is grid
+
+    forget_grid(wall.id)
+    assert locker_grid(wall).device_id(0, 0) is None
+
+    wall.lockers[0]["id"] = "back"
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + grid_module.CACHE_TTL + 1)
+    assert locker_grid(wall).device_id(0, 0) == "back"
+
+
+def test_layout_errors_on_dicts():
+    lockers = [
+        {"x": 0, "y": 0, "id": "a"},
+        {"x": 0, "y": 0, "id": "a"},
+        {"x": 5, "y": 0},
+    ]
+    assert len(layout_errors(2, 2, lockers)) == 3
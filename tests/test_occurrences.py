@@ -0,0 +1,141 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+from common_models.models.reservations.availability import WEEKDAYS
+from common_models.models.reservations.occurrences import (
+    expand_occurrences,
+    occurrences,
+)
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def weekly(days, from_time, to_time, start=None, end=None, name=None):
+    return SimpleNamespace(
+        name=name,
+        recurring=True,
+        from_time=from_time,
+        to_time=to_time,
+        start_date=start,
+        end_date=end,
+        **{day: day in days for day in WEEKDAYS},
+    )
+
+
+def spans(reservation, start, end, tz=NEW_YORK):
+    return [
+        (occurrence.start, occurrence.end)
+        for occurrence in occurrences(reservation, start, end, tz)
+    ]
+
+
+def test_spring_forward_gap_keeps_length():
+    # 2026-03-08 02:00 EST jumps to 03:00 EDT.
+    sunday = weekly(("sunday",), "02:30", "03:30")
+    [(start, end)] = spans(sunday, datetime(2026, 3, 8), datetime(2026, 3, 9))
+
+    assert start == datetime(2026, 3, 8, 3, 30, tzinfo=NEW_YORK)
+    assert end == datetime(2026, 3, 8, 4, 30, tzinfo=NEW_YORK)
+    assert end - start == timedelta(hours=1)
+
+
+def test_window_inside_gap():
+    sunday = weekly(("sunday",), "02:00", "02:30")
+    [(start, end)] = spans(sunday, datetime(2026, 3, 8), datetime(2026, 3, 9))
+    assert (start.hour, start.minute, end.hour, end.minute) == (3, 0, 3, 30)
+
+
+def test_across_spring_forward_keeps_local_times():
+    sunday = weekly(("sunday",), "01:00", "04:00")
+    [(start, end)] = spans(sunday, datetime(2026, 3, 8), datetime(2026, 3, 9))
+    assert (start.hour, end.hour) == (1, 4)
+    assert end.timestamp() - start.timestamp() == 2 * 3600
+
+
+def test_fall_back_takes_first_instant():
+    # 2026-11-01 01:00-02:00 happens twice; the EDT one is used.
+    sunday = weekly(("sunday",), "01:30", "03:00")
+    [(start, end)] = spans(sunday, datetime(2026, 11, 1), datetime(2026, 11, 2))
+
+    assert start.utcoffset() == timedelta(hours=-4)
+    assert start.astimezone(timezone.utc) == datetime(
+        2026, 11, 1, 5, 30, tzinfo=timezone.utc
+    )
+    assert end.utcoffset() == timedelta(hours=-5)
+    assert end.timestamp() - start.timestamp() == 2.5 * 3600
+
+
+def test_overnight_window_spills_into_range():
+    friday = weekly(("friday",), "22:00", "02:00")
+    # Query Saturday only: Friday's occurrence still overlaps it.
+    [(start, end)] = spans(friday, datetime(2026, 5, 9), datetime(2026, 5, 10))
+
+    assert start == datetime(2026, 5, 8, 22, tzinfo=NEW_YORK)
+    assert end == datetime(2026, 5, 9, 2, tzinfo=NEW_YORK)
+
+
+def test_end_date_cuts_off_on_local_day():
+    # Ends 2026-05-13 01:00 UTC, which is still May 12 in New York.
+    daily = weekly(
+        WEEKDAYS,
+        "09:00",
+        "10:00",
+        start=datetime(2026, 5, 10, 12, tzinfo=timezone.utc),
+        end=datetime(2026, 5, 13, 1, tzinfo=timezone.utc),
+    )
+    days = [
+        start.day
+        for start, _ in spans(daily, datetime(2026, 5, 1), datetime(2026, 6, 1))
+    ]
+    assert days == [10, 11, 12]
+
+
+def test_open_ended_range_is_lazy():
+    daily = weekly(WEEKDAYS, "09:00", "10:00")
+    stream = occurrences(daily, datetime(2026, 1, 1), datetime(9999, 1, 1), NEW_YORK)
+    assert next(stream).start == datetime(2026, 1, 1, 9, tzinfo=NEW_YORK)
+
+
+def test_expand_merges_in_start_order():
+    reservations = [
+        weekly(("monday", "wednesday"), "12:00", "13:00", name="noon"),
+        weekly(("monday",), "08:00", "09:00", name="morning"),
+        weekly(("tuesday",), "23:00", "01:00", name="night"),
+        weekly(("monday", "wednesday"), "12:00", "13:00", name="noon-2"),
+        SimpleNamespace(
+            name="once",
+            recurring=False,
+            start_date=datetime(2026, 5, 5, 10),
+            end_date=datetime(2026, 5, 5, 11),
+        ),
+    ]
+    found = [
+        (occurrence.start, occurrence.reservation.name)
+        for occurrence in expand_occurrences(
+            reservations, datetime(2026, 5, 4), datetime(2026, 5, 7), NEW_YORK
+        )
+    ]
+
+    assert [start for start, _ in found] == sorted(start for start, _ in found)
+    assert [name for _, name in found] == [
+        "morning",
+        "noon",
+        "noon-2",
+        "once",
+        "night",
+        "noon",
+        "noon-2",
+    ]
+    for reservation in reservations:
+        assert [
+            occurrence.start
+            for occurrence in expand_occurrences(
+                [reservation], datetime(2026, 5, 4), datetime(2026, 5, 7), NEW_YORK
+            )
+        ] == [
+            occurrence.start
+            for occurrence in occurrences(
+                reservation, datetime(2026, 5, 4), datetime(2026, 5, 7), NEW_YORK
+            )
+        ]
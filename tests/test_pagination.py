@@ -0,0 +1,165 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Column, ForeignKey, Integer, Numeric, String, create_engine
+from sqlalchemy import DateTime, func, select
+from sqlalchemy.orm import Session, declarative_base
+from sqlmodel.sql.sqltypes import GUID
+
+from common_models.models.device.model import Status
+from common_models.util import api_func
+from common_models.util.api_func import (
+    CountStrategy,
+    _decode_cursor,
+    _encode_cursor,
+    _get_paginated_select,
+    _keyset_filter,
+    _split_order_by,
+)
+
+Base = declarative_base()
+
+
+class Shelf(Base):
+    __tablename__ = "shelf"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+
+
+class Book(Base):
+    __tablename__ = "book"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    id_shelf = Column(Integer, ForeignKey("shelf.id"), nullable=False)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Shelf(id=i, name=name) for i, name in enumerate("cab", 1))
+        # Titles sort against the shelf names, so ordering by the wrong
+        # table's column shows up as skipped or repeated rows.
+        session.add_all(
+            Book(id=i, title=f"{'zyx'[i % 3]}{i:02d}", id_shelf=i % 3 + 1)
+            for i in range(1, 14)
+        )
+        session.commit()
+
+        async def execute(statement):
+            return session.execute(statement)
+
+        monkeypatch.setattr(
+            api_func, "db", SimpleNamespace(session=SimpleNamespace(execute=execute))
+        )
+        yield session
+
+
+def paginate(query, order_by, size, cursor=None, page=1):
+    return asyncio.run(
+        _get_paginated_select(
+            query, page, size, order_by, cursor, count_strategy=CountStrategy.none
+        )
+    )
+
+
+def walk(query, order_by, size):
+    pages, cursor = [], None
+    while True:
+        info, rows = paginate(query, order_by, size, cursor)
+        pages.append(rows)
+        if not info.has_next:
+            assert info.next_cursor is None
+            return pages
+        cursor = info.next_cursor
+
+
+def test_cursor_round_trip():
+    columns = [
+        Column("at", DateTime()),
+        Column("id", GUID()),
+        Column("amount", Numeric()),
+        Column("status", String()),
+        Column("rank", Integer()),
+    ]
+    values = [datetime(2026, 5, 4, 9, 30), uuid4(), Decimal("1.10"), "available", 3]
+
+    cursor = _encode_cursor([*values[:3], Status.available, 3])
+    assert "=" not in cursor
+    assert _decode_cursor(cursor, columns) == values
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", _encode_cursor([1]), "e30"])
+def test_invalid_cursor(cursor):
+    columns = [Column("at", DateTime()), Column("id", Integer())]
+    with pytest.raises(HTTPException) as error:
+        _decode_cursor(cursor, columns)
+    assert error.value.status_code == 400
+
+
+def test_keyset_filter_mixed_directions():
+    columns, descending = _split_order_by([Book.title.desc(), Book.id.asc()])
+    assert descending == [True, False]
+
+    clause = _keyset_filter(columns, descending, ["m", 4])
+    assert str(clause.compile(compile_kwargs={"literal_binds": True})) == (
+        "book.title < 'm' OR book.title = 'm' AND book.id > 4"
+    )
+
+
+def test_keyset_filter_single_direction_uses_row_values():
+    columns, descending = _split_order_by([Book.title.desc(), Book.id.desc()])
+    clause = _keyset_filter(columns, descending, ["m", 4])
+    assert str(clause.compile(compile_kwargs={"literal_binds": True})) == (
+        "(book.title, book.id) < ('m', 4)"
+    )
+
+
+@pytest.mark.parametrize(
+    "order_by",
+    [
+        lambda: [Book.id],
+        lambda: [Book.title.desc(), Book.id],
+        lambda: [Shelf.name, Book.id.desc()],
+        lambda: [func.lower(Shelf.name).desc(), Book.title, Book.id],
+    ],
+)
+def test_cursor_pages_cover_every_row_once(session, order_by):
+    order_by = order_by()
+    query = select(Book).join(Shelf, Book.id_shelf == Shelf.id)
+    expected = session.execute(query.order_by(*order_by)).scalars().all()
+
+    pages = walk(query, order_by, 4)
+    assert [len(page) for page in pages] == [4, 4, 4, 1]
+    assert [book for page in pages for book in page] == expected
+
+
+def test_multi_entity_rows(session):
+    query = select(Book, Shelf).join(Shelf, Book.id_shelf == Shelf.id)
+    pages = walk(query, [Shelf.name, Book.id], 5)
+
+    rows = [row for page in pages for row in page]
+    assert len(rows) == 13
+    assert all(isinstance(row, tuple) and len(row) == 2 for row in rows)
+    assert all(book.id_shelf == shelf.id for book, shelf in rows)
+
+
+def test_has_next_and_offset_pages(session):
+    query = select(Book)
+    info, rows = paginate(query, [Book.id], 5, page=3)
+    assert [book.id for book in rows] == [11, 12, 13]
+    assert not info.has_next
+
+    info, rows = paginate(query, [Book.id], 13)
+    assert len(rows) == 13 and not info.has_next
+
+    info, rows = paginate(query, [Book.id], 12)
+    assert info.has_next and info.total is None